@@ -51,7 +51,8 @@ def index():
     """
     try:
         from query_data import get_all_analysis_results
-        raw_results = get_all_analysis_results()
+        # The Spring 2025 total is shown as an estimate, so skip its exact COUNT(*) scan
+        raw_results = get_all_analysis_results(exact=False)
         
         # Convert PostgreSQL results to match template format exactly
         def create_query_structure(answer, question, query="", explanation=""):
@@ -136,8 +137,9 @@ if __name__ == '__main__':
     with app.app_context():
         try:
             # Import models to ensure tables are created
-            from models import Applicant
+            from models import Applicant, migrate_schema
             db.create_all()
+            migrate_schema()
             logger.info("Database tables created successfully")
             
             # Load sample data if database is empty
@@ -13,9 +13,21 @@ including academic metrics, demographics, and admission outcomes for comprehensi
 statistical analysis of Spring 2025 graduate school applications.
 """
 from app import db
-from sqlalchemy import Integer, Text, Date, Float
+from sqlalchemy import Integer, Text, Date, Float, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from datetime import date
 
+# Predicate of the complete-scores partial index, shared by the model and its migration
+COMPLETE_SCORES_PREDICATE = (
+    'gpa IS NOT NULL AND gre IS NOT NULL '
+    'AND gre_v IS NOT NULL AND gre_aw IS NOT NULL'
+)
+
+# Generated program_norm expression, shared by the model and its migration
+PROGRAM_NORM_EXPRESSION = (
+    "to_tsvector('simple', lower(coalesce(program, '')) || ' ' || lower(coalesce(degree, '')))"
+)
+
 class Applicant(db.Model):
     """
     Database model for graduate school applicant data
@@ -26,6 +38,17 @@ class Applicant(db.Model):
     provided in the Module 3 assignment requirements.
     """
     __tablename__ = 'applicants'
+    __table_args__ = (
+        # Partial index covering only rows with every academic metric, so the
+        # average-scores query can use an index-only scan instead of a seq scan
+        db.Index(
+            'ix_applicants_complete_scores',
+            'gpa', 'gre', 'gre_v', 'gre_aw',
+            postgresql_where=text(COMPLETE_SCORES_PREDICATE),
+        ),
+        # Full-text index used by the JHU Computer Science masters query
+        db.Index('ix_applicants_program_norm', 'program_norm', postgresql_using='gin'),
+    )
     
     # Primary key and identification
     p_id = db.Column(Integer, primary_key=True, autoincrement=True)
@@ -51,6 +74,13 @@ class Applicant(db.Model):
     
     # Program type
     degree = db.Column(Text, nullable=True, comment="Degree type (PhD, MS, MA, etc.)")
+    
+    # Normalized program and degree text for indexed full-text matching
+    program_norm = db.Column(
+        TSVECTOR,
+        db.Computed(PROGRAM_NORM_EXPRESSION, persisted=True),
+        comment="Generated search vector over program and degree"
+    )
 
     def __repr__(self):
         """String representation of Applicant object"""
@@ -126,4 +156,31 @@ class Applicant(db.Model):
         # Update defaults with provided kwargs
         defaults.update(kwargs)
         
-        return cls(**defaults)
\ No newline at end of file
+        return cls(**defaults)
+
+# create_all() never alters an existing table, so tables created before the
+# complete-scores index and program_norm were added to the model are migrated
+# with these statements. All are idempotent and safe to run on every start-up.
+SCHEMA_MIGRATION = (
+    "CREATE INDEX IF NOT EXISTS ix_applicants_complete_scores "
+    f"ON applicants (gpa, gre, gre_v, gre_aw) WHERE {COMPLETE_SCORES_PREDICATE}",
+    "ALTER TABLE applicants ADD COLUMN IF NOT EXISTS program_norm tsvector "
+    f"GENERATED ALWAYS AS ({PROGRAM_NORM_EXPRESSION}) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_applicants_program_norm "
+    "ON applicants USING gin (program_norm)",
+)
+
+def migrate_schema():
+    """
+    Add the model's later indexes and program_norm column to an existing applicants table
+    
+    Adding the stored generated column rewrites the table once to compute
+    it for existing rows; later runs find every object present and do
+    nothing. Only PostgreSQL supports the column and partial index, so
+    other databases are left unchanged. Must be called inside an application context.
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return
+    with db.engine.begin() as conn:
+        for statement in SCHEMA_MIGRATION:
+            conn.execute(text(statement))
@@ -12,6 +12,7 @@ Implementation uses PostgreSQL with SQLAlchemy ORM for database operations,
 with comprehensive error handling and logging for production reliability.
 """
 
+import json
 import logging
 from sqlalchemy import text
 from app import app, db
@@ -20,7 +21,134 @@ from app import app, db
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def get_spring_2025_entries():
+def _run_with_connection(query_func, *args):
+    """
+    Run a single query function on its own connection
+    
+    Used by the public get_* wrappers; callers running several queries
+    should open one connection and call the _q_* functions directly.
+    
+    Args:
+        query_func: One of the _q_* functions, taking a connection first
+        *args: Extra arguments passed through to query_func
+        
+    Returns:
+        dict: The query function's result, or error information
+    """
+    try:
+        with app.app_context(), db.engine.connect() as conn:
+            return query_func(conn, *args)
+    except Exception as e:
+        logger.error("Database connection error: %s", e)
+        return {'error': f"Database connection failed: {str(e)}"}
+
+# Trusted WHERE predicates shared by the exact and estimated count paths
+SPRING_2025_FILTER = "term = 'Spring 2025'"
+JHU_CS_MASTERS_FILTER = """(LOWER(program) LIKE '%johns hopkins%' OR LOWER(program) LIKE '%jhu%')
+                AND LOWER(program) LIKE '%computer science%'
+                AND LOWER(degree) LIKE '%master%'"""
+# Full-text form of the JHU filter. The GIN-indexed program_norm match narrows
+# the scan to rows with the same phrases (<-> requires adjacent words in order,
+# :* allows the LIKE patterns' trailing characters); the LIKE filter is then
+# rechecked on those rows, so each phrase must still be in its own field.
+# Only matches inside a longer word, e.g. "supercomputer science", are missed.
+JHU_CS_MASTERS_TSQUERY_FILTER = (
+    "program_norm @@ to_tsquery('simple', "
+    "'(johns <-> hopkins:* | jhu:*) & (computer <-> science:*) & master:*') "
+    f"AND {JHU_CS_MASTERS_FILTER}"
+)
+
+# Whether applicants has the program_norm column; checked once per process
+_has_program_norm = None
+
+def _jhu_cs_masters_filter(conn):
+    """
+    Choose the JHU CS masters predicate supported by the current schema
+    
+    Tables created before program_norm was added to the model lack the
+    generated column until migrate_schema() has run, so those fall
+    back to the original LIKE predicate.
+    
+    Args:
+        conn: Open SQLAlchemy connection
+    
+    Returns:
+        tuple: (predicate SQL, True if the full-text predicate was chosen)
+    """
+    global _has_program_norm
+    if _has_program_norm is None:
+        _has_program_norm = bool(conn.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'applicants' AND column_name = 'program_norm')"
+        )).scalar())
+    if _has_program_norm:
+        return JHU_CS_MASTERS_TSQUERY_FILTER, True
+    return JHU_CS_MASTERS_FILTER, False
+
+def approximate_count(conn, where_clause=None):
+    """
+    Estimate the number of applicant rows matching a WHERE predicate
+    
+    COUNT(*) has to visit every matching row, which is wasteful for headline
+    metrics that are only displayed approximately. This reads the planner's
+    row estimate from EXPLAIN instead, and with no predicate falls back to the
+    reltuples statistic kept in pg_class for the whole table.
+    
+    Args:
+        conn: Open SQLAlchemy connection
+        where_clause (str): Trusted SQL predicate without the WHERE keyword
+        
+    Returns:
+        int: Estimated number of matching rows
+    """
+    if where_clause is None:
+        estimate = conn.execute(text(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = 'applicants'"
+        )).scalar()
+    else:
+        plan = conn.execute(text(
+            f"EXPLAIN (FORMAT JSON) SELECT 1 FROM applicants WHERE {where_clause}"
+        )).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = plan[0]['Plan']['Plan Rows']
+    
+    # reltuples is -1 for tables that have never been analyzed
+    return max(int(estimate or 0), 0)
+
+def _q_spring_2025_entries(conn, exact=True):
+    """
+    Run Query 1 on an open connection; see get_spring_2025_entries()
+    
+    Rolls the connection back on failure so that later queries sharing
+    the same connection can still run.
+    """
+    try:
+        if exact:
+            # Direct SQL query for precise control and transparency
+            query_text = f"SELECT COUNT(*) FROM applicants WHERE {SPRING_2025_FILTER}"
+            result = conn.execute(text(query_text)).scalar()
+        else:
+            query_text = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM applicants WHERE {SPRING_2025_FILTER}"
+            result = approximate_count(conn, SPRING_2025_FILTER)
+        
+        logger.info("Spring 2025 applications query executed: %s records found", result)
+        
+        return {
+            'question': 'How many entries do you have in your database who have applied for Spring 2025?',
+            'answer': result or 0,
+            'estimated': not exact,
+            'query': query_text,
+            'explanation': 'This query counts all applicant records where the term field equals "Spring 2025"',
+            'methodology': 'Simple COUNT aggregation with WHERE clause filtering' if exact
+                           else 'Planner row estimate for the WHERE clause filter'
+        }
+    except Exception as e:
+        conn.rollback()
+        logger.error("Error in Spring 2025 entries query: %s", e)
+        return {'error': f"Database query failed: {str(e)}"}
+
+def get_spring_2025_entries(exact=True):
     """
     Query 1: Count of Spring 2025 Applications
     
@@ -31,27 +159,61 @@ def get_spring_2025_entries():
     submitted for the Spring 2025 academic term across all programs and institutions
     in the dataset. Understanding application volume helps identify admission trends.
     
+    Args:
+        exact (bool): Run an exact COUNT(*); when False, use the planner's
+            row estimate instead of scanning the table
+    
     Returns:
         dict: Query results with count, SQL, and metadata
     """
+    return _run_with_connection(_q_spring_2025_entries, exact)
+
+def _q_international_percentage(conn):
+    """
+    Run Query 2 on an open connection; see get_international_percentage()
+    
+    Rolls the connection back on failure so that later queries sharing
+    the same connection can still run.
+    """
     try:
-        with app.app_context():
-            # Direct SQL query for precise control and transparency
-            query_text = "SELECT COUNT(*) FROM applicants WHERE term = 'Spring 2025'"
-            result = db.session.execute(text(query_text)).scalar()
+        # Calculate percentage using conditional aggregation
+        query_text = """
+        SELECT 
+            COUNT(CASE WHEN us_or_international = 'International' THEN 1 END) * 100.0 / COUNT(*) as intl_percentage,
+            COUNT(CASE WHEN us_or_international = 'International' THEN 1 END) as intl_count,
+            COUNT(*) as total_count
+        FROM applicants 
+        WHERE us_or_international IS NOT NULL
+        """
+        result = conn.execute(text(query_text)).fetchone()
+        
+        if result:
+            percentage = round(float(result[0]), 2) if result[0] else 0
+            intl_count = int(result[1]) if result[1] else 0
+            total = int(result[2]) if result[2] else 0
             
-            logger.info(f"Spring 2025 applications query executed: {result} records found")
+            logger.info("International percentage query: %s%% (%s/%s)", percentage, intl_count, total)
             
             return {
-                'question': 'How many entries do you have in your database who have applied for Spring 2025?',
-                'answer': result or 0,
-                'query': query_text,
-                'explanation': 'This query counts all applicant records where the term field equals "Spring 2025"',
-                'methodology': 'Simple COUNT aggregation with WHERE clause filtering'
+                'question': 'What percentage of entries are from international students?',
+                'answer': f"{percentage}%",
+                'international_count': intl_count,
+                'total_count': total,
+                'query': query_text.strip(),
+                'explanation': f'Calculated from {total} applicants with nationality data: {intl_count} international students',
+                'methodology': 'Conditional COUNT with percentage calculation using CASE WHEN'
+            }
+        else:
+            return {
+                'question': 'What percentage of entries are from international students?',
+                'answer': '0%',
+                'query': query_text.strip(),
+                'explanation': 'No nationality data available for analysis'
             }
     except Exception as e:
-        logger.error(f"Error in Spring 2025 entries query: {str(e)}")
-        return {'error': f"Database query failed: {str(e)}"}
+        conn.rollback()
+        logger.error("Error in international percentage query: %s", e)
+        return {'error': f"International percentage calculation failed: {str(e)}"}
 
 def get_international_percentage():
     """
@@ -66,45 +228,60 @@ def get_international_percentage():
     Returns:
         dict: Percentage of international students with detailed breakdown
     """
+    return _run_with_connection(_q_international_percentage)
+
+def _q_average_scores(conn):
+    """
+    Run Query 3 on an open connection; see get_average_scores()
+    
+    Rolls the connection back on failure so that later queries sharing
+    the same connection can still run.
+    """
     try:
-        with app.app_context():
-            # Calculate percentage using conditional aggregation
-            query_text = """
-            SELECT 
-                COUNT(CASE WHEN us_or_international = 'International' THEN 1 END) * 100.0 / COUNT(*) as intl_percentage,
-                COUNT(CASE WHEN us_or_international = 'International' THEN 1 END) as intl_count,
-                COUNT(*) as total_count
-            FROM applicants 
-            WHERE us_or_international IS NOT NULL
-            """
-            result = db.session.execute(text(query_text)).fetchone()
+        query_text = """
+        SELECT 
+            AVG(gpa) as avg_gpa,
+            AVG(gre) as avg_gre,
+            AVG(gre_v) as avg_gre_v,
+            AVG(gre_aw) as avg_gre_aw,
+            COUNT(*) as complete_records
+        FROM applicants 
+        WHERE gpa IS NOT NULL 
+            AND gre IS NOT NULL 
+            AND gre_v IS NOT NULL 
+            AND gre_aw IS NOT NULL
+        """
+        result = conn.execute(text(query_text)).fetchone()
+        
+        if result and result[0] is not None:
+            avg_scores = {
+                'avg_gpa': round(float(result[0]), 3),
+                'avg_gre': round(float(result[1]), 1),
+                'avg_gre_v': round(float(result[2]), 1),
+                'avg_gre_aw': round(float(result[3]), 2)
+            }
+            count = int(result[4])
+            
+            logger.info("Average scores calculated for %s complete records", count)
             
-            if result:
-                percentage = round(float(result[0]), 2) if result[0] else 0
-                intl_count = int(result[1]) if result[1] else 0
-                total = int(result[2]) if result[2] else 0
-                
-                logger.info(f"International percentage query: {percentage}% ({intl_count}/{total})")
-                
-                return {
-                    'question': 'What percentage of entries are from international students?',
-                    'answer': f"{percentage}%",
-                    'international_count': intl_count,
-                    'total_count': total,
-                    'query': query_text.strip(),
-                    'explanation': f'Calculated from {total} applicants with nationality data: {intl_count} international students',
-                    'methodology': 'Conditional COUNT with percentage calculation using CASE WHEN'
-                }
-            else:
-                return {
-                    'question': 'What percentage of entries are from international students?',
-                    'answer': '0%',
-                    'query': query_text.strip(),
-                    'explanation': 'No nationality data available for analysis'
-                }
+            return {
+                'question': 'What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?',
+                'answer': avg_scores,
+                'query': query_text.strip(),
+                'explanation': 'Calculates mean values for all academic metrics, excluding incomplete records',
+                'methodology': 'AVG aggregation with comprehensive NULL filtering for data quality'
+            }
+        else:
+            return {
+                'question': 'What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?',
+                'answer': {'avg_gpa': 0, 'avg_gre': 0, 'avg_gre_v': 0, 'avg_gre_aw': 0},
+                'query': query_text.strip(),
+                'explanation': 'No complete academic records available for analysis'
+            }
     except Exception as e:
-        logger.error(f"Error in international percentage query: {str(e)}")
-        return {'error': f"International percentage calculation failed: {str(e)}"}
+        conn.rollback()
+        logger.error("Error in average scores query: %s", e)
+        return {'error': f"Average scores calculation failed: {str(e)}"}
 
 def get_average_scores():
     """
@@ -120,51 +297,52 @@ def get_average_scores():
     Returns:
         dict: Average scores for all academic metrics
     """
+    return _run_with_connection(_q_average_scores)
+
+def _q_american_spring_2025_gpa(conn):
+    """
+    Run Query 4 on an open connection; see get_american_spring_2025_gpa()
+    
+    Rolls the connection back on failure so that later queries sharing
+    the same connection can still run.
+    """
     try:
-        with app.app_context():
-            query_text = """
-            SELECT 
-                AVG(gpa) as avg_gpa,
-                AVG(gre) as avg_gre,
-                AVG(gre_v) as avg_gre_v,
-                AVG(gre_aw) as avg_gre_aw,
-                COUNT(*) as complete_records
-            FROM applicants 
-            WHERE gpa IS NOT NULL 
-                AND gre IS NOT NULL 
-                AND gre_v IS NOT NULL 
-                AND gre_aw IS NOT NULL
-            """
-            result = db.session.execute(text(query_text)).fetchone()
+        query_text = """
+        SELECT 
+            AVG(gpa) as avg_gpa,
+            COUNT(*) as american_spring_count
+        FROM applicants 
+        WHERE us_or_international = 'American' 
+            AND term = 'Spring 2025' 
+            AND gpa IS NOT NULL
+        """
+        result = conn.execute(text(query_text)).fetchone()
+        
+        if result and result[0] is not None:
+            avg_gpa = round(float(result[0]), 3)
+            count = int(result[1])
             
-            if result and result[0] is not None:
-                avg_scores = {
-                    'avg_gpa': round(float(result[0]), 3),
-                    'avg_gre': round(float(result[1]), 1),
-                    'avg_gre_v': round(float(result[2]), 1),
-                    'avg_gre_aw': round(float(result[3]), 2)
-                }
-                count = int(result[4])
-                
-                logger.info(f"Average scores calculated for {count} complete records")
-                
-                return {
-                    'question': 'What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?',
-                    'answer': avg_scores,
-                    'query': query_text.strip(),
-                    'explanation': 'Calculates mean values for all academic metrics, excluding incomplete records',
-                    'methodology': 'AVG aggregation with comprehensive NULL filtering for data quality'
-                }
-            else:
-                return {
-                    'question': 'What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?',
-                    'answer': {'avg_gpa': 0, 'avg_gre': 0, 'avg_gre_v': 0, 'avg_gre_aw': 0},
-                    'query': query_text.strip(),
-                    'explanation': 'No complete academic records available for analysis'
-                }
+            logger.info("American Spring 2025 GPA: %s (n=%s)", avg_gpa, count)
+            
+            return {
+                'question': 'What is the average GPA of American students in Spring 2025?',
+                'answer': avg_gpa,
+                'sample_size': count,
+                'query': query_text.strip(),
+                'explanation': 'Calculates mean GPA for domestic students applying Spring 2025',
+                'methodology': 'Filtered AVG aggregation with demographic and term constraints'
+            }
+        else:
+            return {
+                'question': 'What is the average GPA of American students in Spring 2025?',
+                'answer': 0,
+                'query': query_text.strip(),
+                'explanation': 'No American Spring 2025 applicants with GPA data found'
+            }
     except Exception as e:
-        logger.error(f"Error in average scores query: {str(e)}")
-        return {'error': f"Average scores calculation failed: {str(e)}"}
+        conn.rollback()
+        logger.error("Error in American Spring 2025 GPA query: %s", e)
+        return {'error': f"American GPA calculation failed: {str(e)}"}
 
 def get_american_spring_2025_gpa():
     """
@@ -179,43 +357,53 @@ def get_american_spring_2025_gpa():
     Returns:
         dict: Average GPA for American Spring 2025 applicants
     """
+    return _run_with_connection(_q_american_spring_2025_gpa)
+
+def _q_spring_2025_acceptance_rate(conn):
+    """
+    Run Query 5 on an open connection; see get_spring_2025_acceptance_rate()
+    
+    Rolls the connection back on failure so that later queries sharing
+    the same connection can still run.
+    """
     try:
-        with app.app_context():
-            query_text = """
-            SELECT 
-                AVG(gpa) as avg_gpa,
-                COUNT(*) as american_spring_count
-            FROM applicants 
-            WHERE us_or_international = 'American' 
-                AND term = 'Spring 2025' 
-                AND gpa IS NOT NULL
-            """
-            result = db.session.execute(text(query_text)).fetchone()
+        query_text = """
+        SELECT 
+            COUNT(CASE WHEN status = 'Accepted' THEN 1 END) * 100.0 / COUNT(*) as acceptance_rate,
+            COUNT(CASE WHEN status = 'Accepted' THEN 1 END) as accepted_count,
+            COUNT(*) as total_spring_2025
+        FROM applicants 
+        WHERE term = 'Spring 2025'
+        """
+        result = conn.execute(text(query_text)).fetchone()
+        
+        if result:
+            acceptance_rate = round(float(result[0]), 2) if result[0] else 0
+            accepted_count = int(result[1]) if result[1] else 0
+            total_count = int(result[2]) if result[2] else 0
             
-            if result and result[0] is not None:
-                avg_gpa = round(float(result[0]), 3)
-                count = int(result[1])
-                
-                logger.info(f"American Spring 2025 GPA: {avg_gpa} (n={count})")
-                
-                return {
-                    'question': 'What is the average GPA of American students in Spring 2025?',
-                    'answer': avg_gpa,
-                    'sample_size': count,
-                    'query': query_text.strip(),
-                    'explanation': 'Calculates mean GPA for domestic students applying Spring 2025',
-                    'methodology': 'Filtered AVG aggregation with demographic and term constraints'
-                }
-            else:
-                return {
-                    'question': 'What is the average GPA of American students in Spring 2025?',
-                    'answer': 0,
-                    'query': query_text.strip(),
-                    'explanation': 'No American Spring 2025 applicants with GPA data found'
-                }
+            logger.info("Spring 2025 acceptance rate: %s%% (%s/%s)", acceptance_rate, accepted_count, total_count)
+            
+            return {
+                'question': 'What percent of entries for Spring 2025 are Acceptances?',
+                'answer': f"{acceptance_rate}%",
+                'accepted_count': accepted_count,
+                'total_count': total_count,
+                'query': query_text.strip(),
+                'explanation': f'Acceptance rate calculated from {total_count} Spring 2025 applications with {accepted_count} acceptances',
+                'methodology': 'Conditional aggregation using CASE WHEN for percentage calculation'
+            }
+        else:
+            return {
+                'question': 'What percent of entries for Spring 2025 are Acceptances?',
+                'answer': '0%',
+                'query': query_text.strip(),
+                'explanation': 'No Spring 2025 records found for analysis'
+            }
     except Exception as e:
-        logger.error(f"Error in American Spring 2025 GPA query: {str(e)}")
-        return {'error': f"American GPA calculation failed: {str(e)}"}
+        conn.rollback()
+        logger.error("Error in Spring 2025 acceptance rate query: %s", e)
+        return {'error': f"Acceptance rate calculation failed: {str(e)}"}
 
 def get_spring_2025_acceptance_rate():
     """
@@ -230,44 +418,52 @@ def get_spring_2025_acceptance_rate():
     Returns:
         dict: Acceptance rate percentage with detailed breakdown
     """
+    return _run_with_connection(_q_spring_2025_acceptance_rate)
+
+def _q_accepted_spring_2025_gpa(conn):
+    """
+    Run Query 6 on an open connection; see get_accepted_spring_2025_gpa()
+    
+    Rolls the connection back on failure so that later queries sharing
+    the same connection can still run.
+    """
     try:
-        with app.app_context():
-            query_text = """
-            SELECT 
-                COUNT(CASE WHEN status = 'Accepted' THEN 1 END) * 100.0 / COUNT(*) as acceptance_rate,
-                COUNT(CASE WHEN status = 'Accepted' THEN 1 END) as accepted_count,
-                COUNT(*) as total_spring_2025
-            FROM applicants 
-            WHERE term = 'Spring 2025'
-            """
-            result = db.session.execute(text(query_text)).fetchone()
+        query_text = """
+        SELECT 
+            AVG(gpa) as avg_accepted_gpa,
+            COUNT(*) as accepted_spring_count
+        FROM applicants 
+        WHERE term = 'Spring 2025' 
+            AND status = 'Accepted' 
+            AND gpa IS NOT NULL
+        """
+        result = conn.execute(text(query_text)).fetchone()
+        
+        if result and result[0] is not None:
+            avg_gpa = round(float(result[0]), 3)
+            count = int(result[1])
+            
+            logger.info("Accepted Spring 2025 GPA: %s (n=%s)", avg_gpa, count)
             
-            if result:
-                acceptance_rate = round(float(result[0]), 2) if result[0] else 0
-                accepted_count = int(result[1]) if result[1] else 0
-                total_count = int(result[2]) if result[2] else 0
-                
-                logger.info(f"Spring 2025 acceptance rate: {acceptance_rate}% ({accepted_count}/{total_count})")
-                
-                return {
-                    'question': 'What percent of entries for Spring 2025 are Acceptances?',
-                    'answer': f"{acceptance_rate}%",
-                    'accepted_count': accepted_count,
-                    'total_count': total_count,
-                    'query': query_text.strip(),
-                    'explanation': f'Acceptance rate calculated from {total_count} Spring 2025 applications with {accepted_count} acceptances',
-                    'methodology': 'Conditional aggregation using CASE WHEN for percentage calculation'
-                }
-            else:
-                return {
-                    'question': 'What percent of entries for Spring 2025 are Acceptances?',
-                    'answer': '0%',
-                    'query': query_text.strip(),
-                    'explanation': 'No Spring 2025 records found for analysis'
-                }
+            return {
+                'question': 'What is the average GPA of applicants who applied for Spring 2025 who are Acceptances?',
+                'answer': avg_gpa,
+                'accepted_count': count,
+                'query': query_text.strip(),
+                'explanation': f'Average GPA calculated from {count} accepted Spring 2025 applicants with GPA data',
+                'methodology': 'AVG aggregation with dual filtering for term and admission status'
+            }
+        else:
+            return {
+                'question': 'What is the average GPA of applicants who applied for Spring 2025 who are Acceptances?',
+                'answer': 0,
+                'query': query_text.strip(),
+                'explanation': 'No accepted Spring 2025 applicants with GPA data found'
+            }
     except Exception as e:
-        logger.error(f"Error in Spring 2025 acceptance rate query: {str(e)}")
-        return {'error': f"Acceptance rate calculation failed: {str(e)}"}
+        conn.rollback()
+        logger.error("Error in accepted Spring 2025 GPA query: %s", e)
+        return {'error': f"Accepted GPA calculation failed: {str(e)}"}
 
 def get_accepted_spring_2025_gpa():
     """
@@ -283,45 +479,60 @@ def get_accepted_spring_2025_gpa():
     Returns:
         dict: Average GPA of accepted Spring 2025 applicants
     """
+    return _run_with_connection(_q_accepted_spring_2025_gpa)
+
+def _q_jhu_cs_masters_count(conn, exact=True):
+    """
+    Run Query 7 on an open connection; see get_jhu_cs_masters_count()
+    
+    Rolls the connection back on failure so that later queries sharing
+    the same connection can still run.
+    """
     try:
-        with app.app_context():
-            query_text = """
-            SELECT 
-                AVG(gpa) as avg_accepted_gpa,
-                COUNT(*) as accepted_spring_count
-            FROM applicants 
-            WHERE term = 'Spring 2025' 
-                AND status = 'Accepted' 
-                AND gpa IS NOT NULL
-            """
-            result = db.session.execute(text(query_text)).fetchone()
-            
-            if result and result[0] is not None:
-                avg_gpa = round(float(result[0]), 3)
-                count = int(result[1])
-                
-                logger.info(f"Accepted Spring 2025 GPA: {avg_gpa} (n={count})")
-                
-                return {
-                    'question': 'What is the average GPA of applicants who applied for Spring 2025 who are Acceptances?',
-                    'answer': avg_gpa,
-                    'accepted_count': count,
-                    'query': query_text.strip(),
-                    'explanation': f'Average GPA calculated from {count} accepted Spring 2025 applicants with GPA data',
-                    'methodology': 'AVG aggregation with dual filtering for term and admission status'
-                }
-            else:
-                return {
-                    'question': 'What is the average GPA of applicants who applied for Spring 2025 who are Acceptances?',
-                    'answer': 0,
-                    'query': query_text.strip(),
-                    'explanation': 'No accepted Spring 2025 applicants with GPA data found'
-                }
+        where_clause, full_text = _jhu_cs_masters_filter(conn)
+        if exact:
+            query_text = f"""
+        SELECT COUNT(*) as jhu_cs_masters_count
+        FROM applicants 
+        WHERE {where_clause}
+        """
+            result = conn.execute(text(query_text)).scalar()
+        else:
+            query_text = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM applicants WHERE {where_clause}"
+            result = approximate_count(conn, where_clause)
+        count = result if result else 0
+        
+        logger.info("JHU CS Masters applications: %s", count)
+        
+        if not exact:
+            methodology = 'Planner row estimate for the program and degree filters'
+        elif full_text:
+            methodology = ('Full-text match on the GIN-indexed program_norm column, '
+                           'rechecked with case-insensitive LIKE patterns')
+        else:
+            methodology = 'LIKE pattern matching with case-insensitive string comparison'
+        
+        if exact:
+            explanation = f'Pattern matching identified {count} applications to Johns Hopkins Computer Science masters programs'
+        else:
+            # Planner estimates never drop below one row, so don't present them as a match count
+            explanation = (f'The query planner estimates roughly {count} applications to Johns Hopkins '
+                           'Computer Science masters programs; run the exact count to confirm')
+        
+        return {
+            'question': 'How many entries are from applicants who applied to JHU for a masters degree in Computer Science?',
+            'answer': count,
+            'estimated': not exact,
+            'query': query_text,
+            'explanation': explanation,
+            'methodology': methodology
+        }
     except Exception as e:
-        logger.error(f"Error in accepted Spring 2025 GPA query: {str(e)}")
-        return {'error': f"Accepted GPA calculation failed: {str(e)}"}
+        conn.rollback()
+        logger.error("Error in JHU CS masters query: %s", e)
+        return {'error': f"JHU CS masters count failed: {str(e)}"}
 
-def get_jhu_cs_masters_count():
+def get_jhu_cs_masters_count(exact=True):
     """
     Query 7: Johns Hopkins Computer Science Program Analysis
     
@@ -332,35 +543,16 @@ def get_jhu_cs_masters_count():
     Computer Science masters programs, using pattern matching to identify
     relevant applications and understand program-specific application volume.
     
+    Args:
+        exact (bool): Run an exact COUNT(*); when False, use the planner's
+            row estimate instead of scanning the table
+    
     Returns:
         dict: Count of JHU CS masters applications
     """
-    try:
-        with app.app_context():
-            query_text = """
-            SELECT COUNT(*) as jhu_cs_masters_count
-            FROM applicants 
-            WHERE (LOWER(program) LIKE '%johns hopkins%' OR LOWER(program) LIKE '%jhu%')
-                AND LOWER(program) LIKE '%computer science%'
-                AND LOWER(degree) LIKE '%master%'
-            """
-            result = db.session.execute(text(query_text)).scalar()
-            count = result if result else 0
-            
-            logger.info(f"JHU CS Masters applications: {count}")
-            
-            return {
-                'question': 'How many entries are from applicants who applied to JHU for a masters degree in Computer Science?',
-                'answer': count,
-                'query': query_text,
-                'explanation': f'Pattern matching identified {count} applications to Johns Hopkins Computer Science masters programs',
-                'methodology': 'LIKE pattern matching with case-insensitive string comparison'
-            }
-    except Exception as e:
-        logger.error(f"Error in JHU CS masters query: {str(e)}")
-        return {'error': f"JHU CS masters count failed: {str(e)}"}
+    return _run_with_connection(_q_jhu_cs_masters_count, exact)
 
-def get_all_analysis_results():
+def get_all_analysis_results(exact=True):
     """
     Comprehensive Analysis Results Aggregation
     
@@ -368,22 +560,29 @@ def get_all_analysis_results():
     data structure suitable for web presentation and API responses. Includes
     error handling and summary statistics for the complete dataset.
     
+    Args:
+        exact (bool): Passed to the Spring 2025 count; when False, that total
+            comes from a planner estimate instead of a full COUNT(*) scan. The
+            JHU CS masters count is always exact, since a small filtered count
+            is badly served by a row estimate
+    
     Returns:
         dict: Complete analysis results with all query outputs and metadata
     """
     try:
         logger.info("Starting comprehensive analysis of graduate school data...")
         
-        # Execute all analytical queries
-        results = {
-            'spring_2025_entries': get_spring_2025_entries(),
-            'international_percentage': get_international_percentage(),
-            'average_scores': get_average_scores(),
-            'american_spring_2025_gpa': get_american_spring_2025_gpa(),
-            'spring_2025_acceptance_rate': get_spring_2025_acceptance_rate(),
-            'accepted_spring_2025_gpa': get_accepted_spring_2025_gpa(),
-            'jhu_cs_masters_count': get_jhu_cs_masters_count()
-        }
+        # Execute all analytical queries on one shared connection
+        with app.app_context(), db.engine.connect() as conn:
+            results = {
+                'spring_2025_entries': _q_spring_2025_entries(conn, exact),
+                'international_percentage': _q_international_percentage(conn),
+                'average_scores': _q_average_scores(conn),
+                'american_spring_2025_gpa': _q_american_spring_2025_gpa(conn),
+                'spring_2025_acceptance_rate': _q_spring_2025_acceptance_rate(conn),
+                'accepted_spring_2025_gpa': _q_accepted_spring_2025_gpa(conn),
+                'jhu_cs_masters_count': _q_jhu_cs_masters_count(conn)
+            }
         
         # Calculate summary statistics
         total_records = results['spring_2025_entries'].get('answer', 0)
@@ -396,12 +595,12 @@ def get_all_analysis_results():
         }
         
         results['summary'] = analysis_summary
-        logger.info(f"Analysis completed successfully for {total_records} total records")
+        logger.info("Analysis completed successfully for %s total records", total_records)
         
         return results
         
     except Exception as e:
-        logger.error(f"Error in comprehensive analysis: {str(e)}")
+        logger.error("Error in comprehensive analysis: %s", e)
         return {'error': f"Analysis compilation failed: {str(e)}"}
 
 def main():
@@ -417,29 +616,30 @@ def main():
     
     # List of all analytical functions
     queries = [
-        ("Query 1: Spring 2025 Applications", get_spring_2025_entries),
-        ("Query 2: International Percentage", get_international_percentage),
-        ("Query 3: Average Academic Scores", get_average_scores),
-        ("Query 4: American Spring 2025 GPA", get_american_spring_2025_gpa),
-        ("Query 5: Spring 2025 Acceptance Rate", get_spring_2025_acceptance_rate),
-        ("Query 6: Accepted Spring 2025 GPA", get_accepted_spring_2025_gpa),
-        ("Query 7: JHU CS Masters Count", get_jhu_cs_masters_count)
+        ("Query 1: Spring 2025 Applications", _q_spring_2025_entries),
+        ("Query 2: International Percentage", _q_international_percentage),
+        ("Query 3: Average Academic Scores", _q_average_scores),
+        ("Query 4: American Spring 2025 GPA", _q_american_spring_2025_gpa),
+        ("Query 5: Spring 2025 Acceptance Rate", _q_spring_2025_acceptance_rate),
+        ("Query 6: Accepted Spring 2025 GPA", _q_accepted_spring_2025_gpa),
+        ("Query 7: JHU CS Masters Count", _q_jhu_cs_masters_count)
     ]
     
-    # Execute each query and display results
-    for i, (description, query_func) in enumerate(queries, 1):
-        print(f"\n{description}")
-        print("-" * 60)
-        try:
-            result = query_func()
-            if 'error' in result:
-                print(f"ERROR: {result['error']}")
-            else:
-                print(f"Question: {result.get('question', 'N/A')}")
-                print(f"Answer: {result.get('answer', 'N/A')}")
-                print(f"SQL: {result.get('query', 'N/A')}")
-        except Exception as e:
-            print(f"EXCEPTION: {str(e)}")
+    # Execute each query on one shared connection and display results
+    with app.app_context(), db.engine.connect() as conn:
+        for i, (description, query_func) in enumerate(queries, 1):
+            print(f"\n{description}")
+            print("-" * 60)
+            try:
+                result = query_func(conn)
+                if 'error' in result:
+                    print(f"ERROR: {result['error']}")
+                else:
+                    print(f"Question: {result.get('question', 'N/A')}")
+                    print(f"Answer: {result.get('answer', 'N/A')}")
+                    print(f"SQL: {result.get('query', 'N/A')}")
+            except Exception as e:
+                print(f"EXCEPTION: {str(e)}")
     
     print("\n" + "=" * 80)
     print("Analysis Complete")
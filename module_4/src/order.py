@@ -5,7 +5,7 @@ This module defines the Order class that manages customer orders
 containing one or more pizzas.
 """
 
-from typing import List
+from typing import List, Optional
 try:
     from .pizza import Pizza
 except ImportError:
@@ -17,9 +17,13 @@ class Order:
     A class representing a customer order containing pizzas.
     
     An order must contain at least one pizza and tracks the total cost
-    and payment status.
+    and payment status. Pizzas are only added through input_pizza and
+    input_pizzas, which keep the running total and cached description
+    up to date; the pizzas attribute returns a copy of the list.
     """
     
+    __slots__ = ('_pizzas', 'paid', '_total', '_cached_str')
+    
     def __init__(self):
         """
         Initialize an empty order.
@@ -27,8 +31,20 @@ class Order:
         The order starts with an empty list of pizzas, zero cost,
         and unpaid status.
         """
-        self.pizzas: List[Pizza] = []
+        self._pizzas: List[Pizza] = []
         self.paid: bool = False
+        self._total: float = 0.0
+        self._cached_str: Optional[str] = None
+    
+    @property
+    def pizzas(self) -> List[Pizza]:
+        """
+        Return a copy of the pizzas in the order.
+        
+        Returns:
+            List[Pizza]: The pizzas, in the order they were added
+        """
+        return list(self._pizzas)
     
     def input_pizza(self, pizza: Pizza) -> None:
         """
@@ -43,7 +59,30 @@ class Order:
         if not isinstance(pizza, Pizza):
             raise TypeError("Only Pizza objects can be added to an order")
         
-        self.pizzas.append(pizza)
+        self._pizzas.append(pizza)
+        self._total += pizza.cost()
+        self._cached_str = None
+    
+    def input_pizzas(self, pizzas: List[Pizza]) -> None:
+        """
+        Add several pizzas to the order at once.
+        
+        All pizzas are type-checked before any are added, so the order
+        is left unchanged if the batch contains an invalid item.
+        
+        Args:
+            pizzas (List[Pizza]): The pizza objects to add to the order
+        
+        Raises:
+            TypeError: If any input is not a Pizza object
+        """
+        pizzas = list(pizzas)
+        if not all(isinstance(pizza, Pizza) for pizza in pizzas):
+            raise TypeError("Only Pizza objects can be added to an order")
+        
+        self._pizzas.extend(pizzas)
+        self._total += sum(pizza.cost() for pizza in pizzas)
+        self._cached_str = None
     
     def order_paid(self) -> None:
         """
@@ -52,30 +91,49 @@ class Order:
         Updates the paid status to True.
         """
         self.paid = True
+        self._cached_str = None
     
     def cost(self) -> float:
         """
-        Calculate the total cost of the order.
+        Return the total cost of the order.
+        
+        The total is kept up to date as pizzas are added, so this
+        does not need to walk the list of pizzas.
         
         Returns:
             float: The sum of all pizza costs in the order
         """
-        return sum(pizza.cost() for pizza in self.pizzas)
+        return self._total
     
     def __str__(self) -> str:
         """
         Return a string representation of the complete order and cost.
         
+        The description is cached until the order is next changed through
+        input_pizza, input_pizzas, or order_paid. Pizzas are immutable, so
+        their descriptions cannot go stale.
+        
+        Returns:
+            str: A formatted string describing the full order and total cost
+        """
+        if self._cached_str is None:
+            self._cached_str = self._build_str()
+        return self._cached_str
+    
+    def _build_str(self) -> str:
+        """
+        Build the description of the complete order and cost.
+        
         Returns:
             str: A formatted string describing the full order and total cost
         """
-        if not self.pizzas:
+        if not self._pizzas:
             return "Order: No pizzas - $0.00"
         
         order_details = []
         order_details.append("Order:")
         
-        for i, pizza in enumerate(self.pizzas, 1):
+        for i, pizza in enumerate(self._pizzas, 1):
             order_details.append(f"  {i}. {pizza}")
         
         total_cost = self.cost()
@@ -5,9 +5,34 @@ This module defines the Pizza class that represents a customizable pizza
 with various crust, sauce, cheese, and topping options.
 """
 
+from types import MappingProxyType
 from typing import List
 
 
+# Read-only price tables shared by every Pizza
+_CRUST = MappingProxyType({
+    'thin': 5,
+    'thick': 3,
+    'gluten_free': 7
+})
+
+_SAUCE = MappingProxyType({
+    'marinara': 2,
+    'pesto': 3,
+    'liv_sauce': 5
+})
+
+_CHEESE = MappingProxyType({
+    'mozzarella': 1
+})
+
+_TOPPING = MappingProxyType({
+    'pepperoni': 2,
+    'mushrooms': 3,
+    'pineapple': 1
+})
+
+
 class Pizza:
     """
     A class representing a pizza with customizable options.
@@ -20,30 +45,24 @@ class Pizza:
     
     Each pizza must have exactly one crust, at least one sauce, 
     cheese (only Mozzarella), and at least one topping.
-    """
     
-    # Pricing constants
-    CRUST_PRICES = {
-        'thin': 5,
-        'thick': 3,
-        'gluten_free': 7
-    }
+    A pizza should be treated as immutable once created: its cost and
+    description are computed at construction and are not recalculated.
+    The sauce and topping lists are copied in and out, so neither the
+    caller's lists nor the ones returned can change a pizza afterwards.
+    """
     
-    SAUCE_PRICES = {
-        'marinara': 2,
-        'pesto': 3,
-        'liv_sauce': 5
-    }
+    __slots__ = ('crust', '_sauce', 'cheese', '_toppings', '_price', '_str')
     
-    CHEESE_PRICES = {
-        'mozzarella': 1
-    }
+    # Pricing constants (read-only views of the module-level tables)
+    CRUST_PRICES = _CRUST
+    SAUCE_PRICES = _SAUCE
+    CHEESE_PRICES = _CHEESE
+    TOPPING_PRICES = _TOPPING
     
-    TOPPING_PRICES = {
-        'pepperoni': 2,
-        'mushrooms': 3,
-        'pineapple': 1
-    }
+    # Valid ingredient names, used for set-based validation
+    _SAUCE_KEYS = frozenset(SAUCE_PRICES)
+    _TOPPING_KEYS = frozenset(TOPPING_PRICES)
     
     def __init__(self, crust: str, sauce: List[str], cheese: str, toppings: List[str]):
         """
@@ -59,71 +78,110 @@ class Pizza:
             ValueError: If invalid ingredients are provided or requirements not met
         """
         # Validate crust
-        if crust not in self.CRUST_PRICES:
+        if crust not in _CRUST:
             raise ValueError(f"Invalid crust type: {crust}")
         
         # Validate sauce (at least one required)
         if not sauce or not isinstance(sauce, list):
             raise ValueError("At least one sauce is required")
         
-        for s in sauce:
-            if s not in self.SAUCE_PRICES:
-                raise ValueError(f"Invalid sauce type: {s}")
+        invalid_sauces = set(sauce).difference(self._SAUCE_KEYS)
+        if invalid_sauces:
+            names = ", ".join(sorted(map(str, invalid_sauces)))
+            raise ValueError(f"Invalid sauce type: {names}")
         
         # Validate cheese (only mozzarella supported)
-        if cheese not in self.CHEESE_PRICES:
+        if cheese not in _CHEESE:
             raise ValueError(f"Invalid cheese type: {cheese}")
         
         # Validate toppings (at least one required)
         if not toppings or not isinstance(toppings, list):
             raise ValueError("At least one topping is required")
         
-        for t in toppings:
-            if t not in self.TOPPING_PRICES:
-                raise ValueError(f"Invalid topping type: {t}")
+        invalid_toppings = set(toppings).difference(self._TOPPING_KEYS)
+        if invalid_toppings:
+            names = ", ".join(sorted(map(str, invalid_toppings)))
+            raise ValueError(f"Invalid topping type: {names}")
         
         self.crust = crust
-        self.sauce = sauce
+        self._sauce = tuple(sauce)
         self.cheese = cheese
-        self.toppings = toppings
+        self._toppings = tuple(toppings)
+        self._price = self._calculate_price()
+        self._str = self._describe()
     
-    def cost(self) -> float:
+    @property
+    def sauce(self) -> List[str]:
         """
-        Calculate the total cost of the pizza.
+        Return a copy of the pizza's sauces.
         
         Returns:
-            float: The total cost of the pizza
+            List[str]: The sauces, in the order given
         """
-        total = 0.0
-        
-        # Add crust cost
-        total += self.CRUST_PRICES[self.crust]
+        return list(self._sauce)
+    
+    @property
+    def toppings(self) -> List[str]:
+        """
+        Return a copy of the pizza's toppings.
         
-        # Add sauce costs
-        for s in self.sauce:
-            total += self.SAUCE_PRICES[s]
+        Returns:
+            List[str]: The toppings, in the order given
+        """
+        return list(self._toppings)
+    
+    def _calculate_price(self) -> float:
+        """
+        Sum the prices of the pizza's ingredients.
         
-        # Add cheese cost
-        total += self.CHEESE_PRICES[self.cheese]
+        Returns:
+            float: The total cost of the pizza
+        """
+        # Crust and cheese are single lookups
+        total = float(_CRUST[self.crust] + _CHEESE[self.cheese])
         
-        # Add topping costs
-        for t in self.toppings:
-            total += self.TOPPING_PRICES[t]
+        # Sum sauce and topping prices with C-level map() lookups
+        total += sum(map(_SAUCE.__getitem__, self._sauce))
+        total += sum(map(_TOPPING.__getitem__, self._toppings))
         
         return total
     
-    def __str__(self) -> str:
+    def cost(self) -> float:
         """
-        Return a string representation of the pizza and its cost.
+        Return the total cost of the pizza.
+        
+        The cost is calculated once at construction, since the
+        ingredients of a pizza do not change afterwards.
+        
+        Returns:
+            float: The total cost of the pizza
+        """
+        return self._price
+    
+    def _describe(self) -> str:
+        """
+        Build the description of the pizza and its cost.
         
         Returns:
             str: A formatted string describing the pizza and cost
         """
-        sauce_str = ", ".join(self.sauce)
-        toppings_str = ", ".join(self.toppings)
+        sauce_str = ", ".join(self._sauce)
+        toppings_str = ", ".join(self._toppings)
         
         return (f"Pizza: {self.crust.replace('_', ' ').title()} crust, "
                 f"{sauce_str.replace('_', ' ').title()} sauce, "
                 f"{self.cheese.title()} cheese, "
                 f"with {toppings_str.replace('_', ' ').title()} - "
-                f"${self.cost():.2f}")
+                f"${self._price:.2f}")
+    
+    def __str__(self) -> str:
+        """
+        Return a string representation of the pizza and its cost.
+        
+        The description is built once at construction; pizzas are
+        treated as immutable after they are created.
+        
+        Returns:
+            str: A formatted string describing the pizza and cost
+        """
+        return self._str
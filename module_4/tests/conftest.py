@@ -0,0 +1,28 @@
+"""
+Shared fixtures for the pizza ordering system tests.
+
+Pizzas are treated as immutable once created, so the canonical pizzas
+used across the suite are built once per session and shared. Orders are
+mutated by the tests and are always created fresh.
+"""
+
+import sys
+
+# The test modules are tiny, so writing rewritten .pyc files for them costs
+# more than it saves; set before pytest imports and rewrites the test modules
+sys.dont_write_bytecode = True
+
+import pytest  # pylint: disable=wrong-import-position
+from src.pizza import Pizza  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(scope="session")
+def thin_marinara_pineapple():
+    """Thin crust, marinara, mozzarella, pineapple: $5 + $2 + $1 + $1 = $9."""
+    return Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+
+
+@pytest.fixture(scope="session")
+def thick_pesto_mushrooms():
+    """Thick crust, pesto, mozzarella, mushrooms: $3 + $3 + $1 + $3 = $10."""
+    return Pizza('thick', ['pesto'], 'mozzarella', ['mushrooms'])
@@ -16,7 +16,7 @@ from src.pizza import Pizza
 class TestIntegration:
     """Integration test cases for Order and Pizza interaction."""
     
-    def test_multiple_pizzas_per_order(self):
+    def test_multiple_pizzas_per_order(self, thin_marinara_pineapple, thick_pesto_mushrooms):
         """
         Test that code can handle multiple pizza objects per order.
         
@@ -27,11 +27,11 @@ class TestIntegration:
         
         # Create first pizza: Thin Crust, Marinara, Mozzarella, Pineapple
         # Cost: $5 + $2 + $1 + $1 = $9
-        pizza1 = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        pizza1 = thin_marinara_pineapple
         
         # Create second pizza: Thick Crust, Pesto, Mozzarella, Mushrooms
         # Cost: $3 + $3 + $1 + $3 = $10
-        pizza2 = Pizza('thick', ['pesto'], 'mozzarella', ['mushrooms'])
+        pizza2 = thick_pesto_mushrooms
         
         # Add pizzas to order
         order.input_pizza(pizza1)
@@ -84,13 +84,33 @@ class TestIntegration:
         assert pizza2_2.cost() == 19  # 5 + 5 + 3 + 1 + 3 + 2
         assert order2.cost() == 30
     
-    def test_order_string_with_multiple_pizzas(self):
+    def test_running_total_matches_pizza_costs(self, thin_marinara_pineapple, thick_pesto_mushrooms):
+        """
+        Test the order's running total agrees with its pizzas' costs.
+        
+        Pizza and order costs are computed as pizzas are created and
+        added, so the total must match after mixed single and bulk adds.
+        """
+        order = Order()
+        pizzas = [
+            thin_marinara_pineapple,
+            thick_pesto_mushrooms,
+            Pizza('gluten_free', ['liv_sauce', 'pesto'], 'mozzarella', ['pepperoni', 'mushrooms']),
+        ]
+        
+        order.input_pizza(pizzas[0])
+        order.input_pizzas(pizzas[1:])
+        
+        assert order.cost() == sum(pizza.cost() for pizza in order.pizzas)
+        assert order.cost() == 9 + 10 + 21
+    
+    def test_order_string_with_multiple_pizzas(self, thin_marinara_pineapple, thick_pesto_mushrooms):
         """
         Test order string representation with multiple pizzas.
         """
         order = Order()
-        pizza1 = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
-        pizza2 = Pizza('thick', ['pesto'], 'mozzarella', ['mushrooms'])
+        pizza1 = thin_marinara_pineapple
+        pizza2 = thick_pesto_mushrooms
         
         order.input_pizza(pizza1)
         order.input_pizza(pizza2)
@@ -104,12 +124,12 @@ class TestIntegration:
         assert f"${order.cost():.2f}" in order_str
         assert "Status: Unpaid" in order_str
     
-    def test_payment_workflow_integration(self):
+    def test_payment_workflow_integration(self, thin_marinara_pineapple):
         """
         Test complete order and payment workflow.
         """
         order = Order()
-        pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        pizza = thin_marinara_pineapple
         
         # Initial state
         assert order.cost() == 0
@@ -29,6 +29,14 @@ class TestOrder:
         assert order.cost() == 0
         assert order.paid is False
     
+    def test_order_uses_slots(self):
+        """
+        Test order instances store their attributes in __slots__.
+        """
+        order = Order()
+        
+        assert not hasattr(order, '__dict__')
+    
     def test_order_str_empty(self):
         """
         Test order __str__() method with empty order.
@@ -40,15 +48,15 @@ class TestOrder:
         result = str(order)
         assert "Order: No pizzas - $0.00" in result
     
-    def test_order_str_with_pizzas(self):
+    def test_order_str_with_pizzas(self, thin_marinara_pineapple, thick_pesto_mushrooms):
         """
         Test order __str__() method with pizzas.
         
         Test order should return a string containing customer full order and cost.
         """
         order = Order()
-        pizza1 = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
-        pizza2 = Pizza('thick', ['pesto'], 'mozzarella', ['mushrooms'])
+        pizza1 = thin_marinara_pineapple
+        pizza2 = thick_pesto_mushrooms
         
         order.input_pizza(pizza1)
         order.input_pizza(pizza2)
@@ -60,14 +68,14 @@ class TestOrder:
         assert str(pizza1.cost()) in result or f"${pizza1.cost():.2f}" in result
         assert str(pizza2.cost()) in result or f"${pizza2.cost():.2f}" in result
     
-    def test_order_input_pizza_updates_cost(self):
+    def test_order_input_pizza_updates_cost(self, thin_marinara_pineapple):
         """
         Test order input_pizza() method.
         
         Test method should update cost.
         """
         order = Order()
-        pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        pizza = thin_marinara_pineapple
         
         initial_cost = order.cost()
         order.input_pizza(pizza)
@@ -89,6 +97,45 @@ class TestOrder:
         with pytest.raises(TypeError):
             order.input_pizza(123)
     
+    def test_order_input_pizzas_updates_cost(self, thin_marinara_pineapple, thick_pesto_mushrooms):
+        """
+        Test order input_pizzas() method adds every pizza and updates cost.
+        """
+        order = Order()
+        pizza1 = thin_marinara_pineapple
+        pizza2 = thick_pesto_mushrooms
+        
+        order.input_pizzas([pizza1, pizza2])
+        
+        assert order.pizzas == [pizza1, pizza2]
+        assert order.cost() == pizza1.cost() + pizza2.cost()
+    
+    def test_order_input_pizzas_invalid_type(self, thin_marinara_pineapple):
+        """
+        Test order input_pizzas() method rejects the whole batch on invalid input.
+        """
+        order = Order()
+        pizza = thin_marinara_pineapple
+        
+        with pytest.raises(TypeError):
+            order.input_pizzas([pizza, "not a pizza"])
+        
+        assert order.pizzas == []
+        assert order.cost() == 0
+    
+    def test_order_pizzas_cannot_be_changed_directly(self, thin_marinara_pineapple):
+        """
+        Test changing the returned pizza list does not change the order.
+        """
+        order = Order()
+        order.input_pizza(thin_marinara_pineapple)
+        
+        order.pizzas.append(thin_marinara_pineapple)
+        
+        assert order.pizzas == [thin_marinara_pineapple]
+        assert order.cost() == thin_marinara_pineapple.cost()
+        assert "2." not in str(order)
+    
     def test_order_paid(self):
         """
         Test order order_paid() method.
@@ -101,12 +148,12 @@ class TestOrder:
         order.order_paid()
         assert order.paid is True
     
-    def test_order_str_shows_paid_status(self):
+    def test_order_str_shows_paid_status(self, thin_marinara_pineapple):
         """
         Test that __str__ shows correct payment status.
         """
         order = Order()
-        pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        pizza = thin_marinara_pineapple
         order.input_pizza(pizza)
         
         # Test unpaid status
@@ -117,3 +164,17 @@ class TestOrder:
         order.order_paid()
         result_paid = str(order)
         assert "Status: Paid" in result_paid
+    
+    def test_order_str_updates_after_adding_pizza(self, thin_marinara_pineapple,
+                                                  thick_pesto_mushrooms):
+        """
+        Test that __str__ reflects pizzas added after it was last called.
+        """
+        order = Order()
+        order.input_pizza(thin_marinara_pineapple)
+        assert "2." not in str(order)
+        
+        order.input_pizzas([thick_pesto_mushrooms])
+        result = str(order)
+        assert "2." in result
+        assert f"${order.cost():.2f}" in result
@@ -40,6 +40,43 @@ class TestPizza:
         
         assert pizza.cost() > 0
     
+    def test_pizza_uses_slots(self, thin_marinara_pineapple):
+        """
+        Test pizza instances store their attributes in __slots__.
+        """
+        pizza = thin_marinara_pineapple
+        
+        assert not hasattr(pizza, '__dict__')
+        with pytest.raises(AttributeError):
+            pizza.extra = 'olives'
+    
+    def test_pizza_price_tables_are_read_only(self):
+        """
+        Test the shared price tables cannot be modified.
+        """
+        with pytest.raises(TypeError):
+            Pizza.CRUST_PRICES['thin'] = 0
+        
+        assert Pizza.CRUST_PRICES['thin'] == 5
+    
+    def test_pizza_ingredient_lists_are_copied(self):
+        """
+        Test changing the caller's or the returned lists does not change a pizza.
+        """
+        sauce = ['marinara']
+        toppings = ['pineapple']
+        pizza = Pizza('thin', sauce, 'mozzarella', toppings)
+        
+        sauce.append('liv_sauce')
+        toppings.append('pepperoni')
+        pizza.sauce.append('pesto')
+        pizza.toppings.append('mushrooms')
+        
+        assert pizza.sauce == ['marinara']
+        assert pizza.toppings == ['pineapple']
+        assert pizza.cost() == 9.0
+        assert str(pizza) == "Pizza: Thin crust, Marinara sauce, Mozzarella cheese, with Pineapple - $9.00"
+    
     def test_pizza_init_multiple_sauces_toppings(self):
         """
         Test pizza initialization with multiple sauces and toppings.
@@ -63,6 +100,13 @@ class TestPizza:
         with pytest.raises(ValueError, match="Invalid sauce type"):
             Pizza('thin', ['invalid_sauce'], 'mozzarella', ['pineapple'])
     
+    def test_pizza_init_reports_all_invalid_sauces(self):
+        """
+        Test pizza initialization lists every invalid sauce in the error.
+        """
+        with pytest.raises(ValueError, match="Invalid sauce type: bbq, ranch"):
+            Pizza('thin', ['ranch', 'marinara', 'bbq'], 'mozzarella', ['pineapple'])
+    
     def test_pizza_init_empty_sauce(self):
         """
         Test pizza initialization with empty sauce list.
@@ -91,13 +135,13 @@ class TestPizza:
         with pytest.raises(ValueError, match="At least one topping is required"):
             Pizza('thin', ['marinara'], 'mozzarella', [])
     
-    def test_pizza_str(self):
+    def test_pizza_str(self, thin_marinara_pineapple):
         """
         Test pizza __str__() method.
         
         Test pizza should return a string containing the pizza and cost.
         """
-        pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        pizza = thin_marinara_pineapple
         result = str(pizza)
         
         assert "Pizza:" in result
@@ -108,14 +152,14 @@ class TestPizza:
         assert "$" in result
         assert str(pizza.cost()) in result or f"{pizza.cost():.2f}" in result
     
-    def test_pizza_cost_simple(self):
+    def test_pizza_cost_simple(self, thin_marinara_pineapple):
         """
         Test pizza cost() method with simple pizza.
         
         Test return of correct cost for an input pizza.
         E.g. a Thin Crust, Marinara, Mozzarella pizza with Pineapple will cost: $5 + $2 + $1 + $1 = $9
         """
-        pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        pizza = thin_marinara_pineapple
         expected_cost = 5 + 2 + 1 + 1  # thin + marinara + mozzarella + pineapple
         
         assert pizza.cost() == expected_cost
@@ -132,13 +176,13 @@ class TestPizza:
         
         assert pizza.cost() == expected_cost
     
-    def test_pizza_cost_all_crusts(self):
+    def test_pizza_cost_all_crusts(self, thin_marinara_pineapple):
         """
         Test pizza cost calculation for different crust types.
         """
         base_cost = 2 + 1 + 1  # marinara + mozzarella + pineapple
         
-        thin_pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        thin_pizza = thin_marinara_pineapple
         assert thin_pizza.cost() == 5 + base_cost
         
         thick_pizza = Pizza('thick', ['marinara'], 'mozzarella', ['pineapple'])
@@ -147,13 +191,13 @@ class TestPizza:
         gf_pizza = Pizza('gluten_free', ['marinara'], 'mozzarella', ['pineapple'])
         assert gf_pizza.cost() == 7 + base_cost
     
-    def test_pizza_cost_all_sauces(self):
+    def test_pizza_cost_all_sauces(self, thin_marinara_pineapple):
         """
         Test pizza cost calculation for different sauce types.
         """
         base_cost = 5 + 1 + 1  # thin + mozzarella + pineapple
         
-        marinara_pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        marinara_pizza = thin_marinara_pineapple
         assert marinara_pizza.cost() == base_cost + 2
         
         pesto_pizza = Pizza('thin', ['pesto'], 'mozzarella', ['pineapple'])
@@ -162,7 +206,7 @@ class TestPizza:
         liv_pizza = Pizza('thin', ['liv_sauce'], 'mozzarella', ['pineapple'])
         assert liv_pizza.cost() == base_cost + 5
     
-    def test_pizza_cost_all_toppings(self):
+    def test_pizza_cost_all_toppings(self, thin_marinara_pineapple):
         """
         Test pizza cost calculation for different topping types.
         """
@@ -174,5 +218,5 @@ class TestPizza:
         mushroom_pizza = Pizza('thin', ['marinara'], 'mozzarella', ['mushrooms'])
         assert mushroom_pizza.cost() == base_cost + 3
         
-        pineapple_pizza = Pizza('thin', ['marinara'], 'mozzarella', ['pineapple'])
+        pineapple_pizza = thin_marinara_pineapple
         assert pineapple_pizza.cost() == base_cost + 1
@@ -12,11 +12,10 @@ import os
 import logging
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +40,18 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_recycle": 300,
     "pool_pre_ping": True,
 }
+if make_url(DATABASE_URL).get_driver_name() == "psycopg2":
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update({
+        # Room for concurrent workers; LIFO keeps a small set of warm connections
+        "pool_size": 20,
+        "max_overflow": 30,
+        "pool_use_lifo": True,
+        # Batch executemany() calls into multi-row statements
+        "executemany_mode": "values_plus_batch",
+    })
+
+# Token required by the cache flush admin route; the route is disabled if unset
+app.config["CACHE_FLUSH_TOKEN"] = os.environ.get("CACHE_FLUSH_TOKEN")
 
 # Initialize database
 db.init_app(app)
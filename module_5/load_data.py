@@ -9,113 +9,287 @@ Author: Abdullateef Mumin
 """
 
 import os
+import io
 import csv
 import json
 import logging
-from datetime import datetime, date
-from typing import List, Dict, Any, Optional
-from faker import Faker
+from datetime import datetime, date, timedelta
+from typing import List, Dict, Any, Optional, Tuple
 import random
-import psycopg2
-from psycopg2 import sql
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, chain
+from operator import itemgetter
+from sqlalchemy import text
 from app import app, db
-from models import Applicant
-from security_utils import InputValidator
+from models import Applicant, mark_data_changed
+from security_utils import (sanitize_string, validate_nationality, validate_numeric,
+                            validate_status, validate_term)
 
-# Configure logging for data loading operations
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Faker for realistic data generation
-fake = Faker()
+# Sample programs and comments, sanitized once at import rather than per record
+SAMPLE_UNIVERSITIES = [
+    "Stanford University - Computer Science",
+    "MIT - Computer Science",
+    "Johns Hopkins University - Computer Science",
+    "Carnegie Mellon University - Computer Science",
+    "University of California, Berkeley - Computer Science",
+    "Georgia Institute of Technology - Computer Science",
+    "University of Washington - Computer Science",
+    "Princeton University - Computer Science",
+    "Harvard University - Computer Science",
+    "Yale University - Computer Science"
+]
+SAMPLE_COMMENTS = [
+    "Excited about the research opportunities in this program",
+    "Strong faculty match for my research interests",
+    "Excellent program reputation and alumni network",
+    "Great location and campus facilities",
+    "Competitive funding package offered"
+]
 
+SANITIZED_UNIVERSITIES = [sanitize_string(u) for u in SAMPLE_UNIVERSITIES]
+SANITIZED_COMMENTS = [sanitize_string(c) for c in SAMPLE_COMMENTS]
 
-def generate_realistic_applicant_data(count: int = 10000) -> List[Dict[str, Any]]:
+# Categorical distributions, with cumulative weights precomputed for random.choices
+DEGREE_TYPES = ["MS", "PhD", "Master", "Masters", "M.S.", "Ph.D."]
+STATUSES = ["Accepted", "Rejected", "Waitlisted", "Pending"]
+STATUS_CUM_WEIGHTS = list(accumulate([0.25, 0.55, 0.15, 0.05]))
+NATIONALITIES = ["American", "International", "Other"]
+NATIONALITY_CUM_WEIGHTS = list(accumulate([0.60, 0.35, 0.05]))
+
+# Below this many records, sample data is generated in a single process
+PARALLEL_GENERATION_THRESHOLD = 50000
+
+# Records per independently seeded generation chunk; fixed so that seeded
+# output does not depend on how many processes generate the chunks
+GENERATION_CHUNK_SIZE = 10000
+
+
+def _generate_scores(
+        count: int, rng: random.Random
+) -> Tuple[List[float], List[float], List[float], List[float]]:
     """
-    Generate realistic graduate school applicant data for analysis.
+    Generate the GPA and GRE score columns in one fused pass.
+    
+    Each value is drawn from a normal distribution and clamped to its valid
+    range in the same step, so the columns need no separate validation.
+    
+    Args:
+        count: Number of values to generate per column
+        rng: Random number generator to draw from
+        
+    Returns:
+        Tuple[List[float], ...]: GPA, GRE quant, GRE verbal, and GRE writing columns
+    """
+    normal = rng.normalvariate
+    gpas, gre_quants, gre_verbals, gre_writings = [], [], [], []
+    
+    for _ in range(count):
+        gpas.append(max(2.0, min(4.0, round(normal(3.6, 0.4), 2))))
+        gre_quants.append(float(max(130, min(170, int(normal(162, 8))))))
+        gre_verbals.append(float(max(130, min(170, int(normal(155, 7))))))
+        gre_writings.append(max(0.0, min(6.0, round(normal(4.2, 0.8), 1))))
+    
+    return gpas, gre_quants, gre_verbals, gre_writings
+
+
+def _gen_chunk(count: int, offset: int, seed: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    Generate one contiguous chunk of applicant records.
     
     Args:
         count: Number of applicant records to generate
+        offset: Number of records before this chunk; p_ids start at offset + 1
+        seed: Optional seed for reproducible data; random if omitted
         
     Returns:
         List[Dict[str, Any]]: Generated applicant data dictionaries
     """
-    logger.info("Generating %s realistic applicant records...", count)
+    rng = random.Random(seed)
+    
+    # Generate whole columns rather than field by field per record;
+    # categorical columns are drawn with one rng.choices call each
+    gpas, gre_quants, gre_verbals, gre_writings = _generate_scores(count, rng)
+    
+    status_column = rng.choices(STATUSES, cum_weights=STATUS_CUM_WEIGHTS, k=count)
+    nationality_column = rng.choices(NATIONALITIES, cum_weights=NATIONALITY_CUM_WEIGHTS,
+                                     k=count)
+    program_column = rng.choices(SANITIZED_UNIVERSITIES, k=count)
+    comment_column = rng.choices(SANITIZED_COMMENTS, k=count)
+    degree_column = rng.choices(DEGREE_TYPES, k=count)
     
-    # Define realistic data distributions
-    universities = [
-        "Stanford University - Computer Science",
-        "MIT - Computer Science", 
-        "Johns Hopkins University - Computer Science",
-        "Carnegie Mellon University - Computer Science",
-        "University of California, Berkeley - Computer Science",
-        "Georgia Institute of Technology - Computer Science",
-        "University of Washington - Computer Science",
-        "Princeton University - Computer Science",
-        "Harvard University - Computer Science",
-        "Yale University - Computer Science"
-    ]
-    
-    degree_types = ["MS", "PhD", "Master", "Masters", "M.S.", "Ph.D."]
-    statuses = ["Accepted", "Rejected", "Waitlisted", "Pending"]
-    status_weights = [0.25, 0.55, 0.15, 0.05]
-    nationalities = ["American", "International", "Other"]
-    nationality_weights = [0.60, 0.35, 0.05]
-    
-    comments_templates = [
-        "Excited about the research opportunities in this program",
-        "Strong faculty match for my research interests",
-        "Excellent program reputation and alumni network",
-        "Great location and campus facilities",
-        "Competitive funding package offered"
-    ]
+    # Dates are drawn from the last six months, computed once up front
+    today = date.today()
+    recent_dates = [today - timedelta(days=days) for days in range(181)]
+    date_column = rng.choices(recent_dates, k=count)
     
     applicants = []
+    columns = zip(gpas, gre_quants, gre_verbals, gre_writings, status_column,
+                  nationality_column, program_column, comment_column, degree_column,
+                  date_column)
     
-    for i in range(count):
-        # Generate realistic academic scores with proper distributions
-        gpa = round(random.normalvariate(3.6, 0.4), 2)
-        gpa = max(2.0, min(4.0, gpa))  # Clamp to valid range
-        
-        gre_quant = int(random.normalvariate(162, 8))
-        gre_quant = max(130, min(170, gre_quant))
-        
-        gre_verbal = int(random.normalvariate(155, 7))
-        gre_verbal = max(130, min(170, gre_verbal))
-        
-        gre_writing = round(random.normalvariate(4.2, 0.8), 1)
-        gre_writing = max(0.0, min(6.0, gre_writing))
-        
-        # Select weighted random values
-        status = random.choices(statuses, weights=status_weights)[0]
-        nationality = random.choices(nationalities, weights=nationality_weights)[0]
-        
-        # Validate generated data
-        program = InputValidator.sanitize_string(random.choice(universities))
-        comments = InputValidator.sanitize_string(random.choice(comments_templates))
-        
+    for i, (gpa, gre_quant, gre_verbal, gre_writing, status, nationality,
+            program, comments, degree, date_added) in enumerate(columns, offset + 1):
         applicant = {
-            'p_id': i + 1,
+            'p_id': i,
             'program': program,
             'comments': comments,
-            'date_added': fake.date_between(start_date='-6m', end_date='today'),
-            'url': f"https://www.gradcafe.com/survey/{random.randint(10000, 99999)}",
+            'date_added': date_added,
+            'url': f"https://www.gradcafe.com/survey/{rng.randint(10000, 99999)}",
             'status': status,
             'term': 'Spring 2025',
             'us_or_international': nationality,
-            'gpa': InputValidator.validate_numeric(gpa, 0.0, 4.0),
-            'gre': InputValidator.validate_numeric(gre_quant, 130, 170),
-            'gre_v': InputValidator.validate_numeric(gre_verbal, 130, 170),
-            'gre_aw': InputValidator.validate_numeric(gre_writing, 0.0, 6.0),
-            'degree': random.choice(degree_types)
+            'gpa': gpa,
+            'gre': gre_quant,
+            'gre_v': gre_verbal,
+            'gre_aw': gre_writing,
+            'degree': degree
         }
         
         applicants.append(applicant)
     
+    return applicants
+
+
+def generate_realistic_applicant_data(count: int = 10000,
+                                      seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Generate realistic graduate school applicant data for analysis.
+    
+    Records are generated in GENERATION_CHUNK_SIZE chunks, each seeded from
+    the caller's seed, so a seeded run yields the same data on any machine
+    and whether the chunks are generated serially or in parallel. Large
+    datasets spread the chunks over worker processes; below
+    PARALLEL_GENERATION_THRESHOLD records the cost of starting workers and
+    pickling results outweighs the gain.
+    
+    Args:
+        count: Number of applicant records to generate
+        seed: Optional seed for reproducible data; random if omitted
+        
+    Returns:
+        List[Dict[str, Any]]: Generated applicant data dictionaries
+    """
+    logger.info("Generating %s realistic applicant records...", count)
+    
+    # Fixed-size chunks, each with its own seed drawn from the caller's
+    offsets = list(range(0, count, GENERATION_CHUNK_SIZE))
+    sizes = [min(GENERATION_CHUNK_SIZE, count - offset) for offset in offsets]
+    seed_rng = random.Random(seed)
+    seeds = [seed_rng.getrandbits(64) for _ in offsets]
+    
+    workers = min(os.cpu_count() or 1, len(offsets))
+    if count < PARALLEL_GENERATION_THRESHOLD or workers <= 1:
+        chunks = map(_gen_chunk, sizes, offsets, seeds)
+        applicants = list(chain.from_iterable(chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_gen_chunk, sizes, offsets, seeds)
+            applicants = list(chain.from_iterable(chunks))
+    
     logger.info("Generated %s realistic applicant records", len(applicants))
     return applicants
 
 
+@lru_cache(maxsize=4096)
+def _parse_csv_date(value: str) -> date:
+    """
+    Parse a CSV date in ISO or US format, falling back to a default date.
+    
+    Strings shaped like YYYY-MM-DD go through the C-implemented
+    date.fromisoformat; anything else takes the original strptime formats,
+    since fromisoformat also accepts forms such as 20250115 or 2025-W03-1
+    that strptime rejects. Results are cached because exported datasets
+    repeat the same dates across many rows.
+    
+    Args:
+        value: Raw date string from the CSV file
+        
+    Returns:
+        date: Parsed date, or 2024-03-15 if no format matches
+    """
+    if len(value) == 10 and value[4] == value[7] == '-':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    for date_format in ('%Y-%m-%d', '%m/%d/%Y'):
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    return date(2024, 3, 15)
+
+
+def _column(row: List[str], columns: Dict[str, int], name: str, default: Any = None) -> Any:
+    """
+    Look up a field of a csv.reader row by column name.
+    
+    Mirrors csv.DictReader: a column missing from the header yields the
+    default, and a field missing from a short row yields None.
+    
+    Args:
+        row: Raw CSV row values
+        columns: Map of header names to column positions
+        name: Column to look up
+        default: Value returned if the header has no such column
+        
+    Returns:
+        Any: The raw field value, the default, or None
+    """
+    position = columns.get(name)
+    if position is None:
+        return default
+    return row[position] if position < len(row) else None
+
+
+def _parse_row(row: List[str], columns: Dict[str, int], row_num: int) -> Dict[str, Any]:
+    """
+    Sanitize and validate a single CSV row.
+    
+    The validators return None or an empty string for bad field values
+    rather than raising. A missing or invalid p_id becomes None, and the
+    database assigns the record a key from its sequence on insert.
+    
+    Args:
+        row: Raw CSV row values
+        columns: Map of header names to column positions
+        row_num: 1-based data row number, used as the default p_id
+        
+    Returns:
+        Dict[str, Any]: Applicant data
+    """
+    def field(name: str, default: Any = None) -> Any:
+        return _column(row, columns, name, default)
+    
+    p_id = validate_numeric(field('p_id', row_num), 1)
+    
+    # Parse date with multiple format support
+    raw_date = field('date_added')
+    date_added = _parse_csv_date(raw_date) if raw_date else None
+    
+    # Sanitize and validate all input fields
+    return {
+        'p_id': p_id,
+        'program': sanitize_string(field('program', '')),
+        'comments': sanitize_string(field('comments', '')),
+        'date_added': date_added,
+        'url': sanitize_string(field('url', '')),
+        'status': sanitize_string(field('status', '')),
+        'term': sanitize_string(field('term', 'Spring 2025')),
+        'us_or_international': sanitize_string(
+            field('us_or_international', '')
+        ),
+        'gpa': validate_numeric(field('gpa'), 0.0, 4.0),
+        'gre': validate_numeric(field('gre'), 130, 170),
+        'gre_v': validate_numeric(field('gre_v'), 130, 170),
+        'gre_aw': validate_numeric(field('gre_aw'), 0.0, 6.0),
+        'degree': sanitize_string(field('degree', ''))
+    }
+
+
 def load_data_from_csv(csv_file_path: str) -> List[Dict[str, Any]]:
     """
     Load applicant data from CSV file with comprehensive validation.
@@ -130,130 +304,272 @@ def load_data_from_csv(csv_file_path: str) -> List[Dict[str, Any]]:
         logger.warning("CSV file not found: %s", csv_file_path)
         return []
     
-    data = []
     try:
         with open(csv_file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row_num, row in enumerate(reader, 1):
-                try:
-                    # Parse date with multiple format support
-                    date_added = None
-                    if row.get('date_added'):
-                        try:
-                            date_added = datetime.strptime(row['date_added'], '%Y-%m-%d').date()
-                        except ValueError:
-                            try:
-                                date_added = datetime.strptime(row['date_added'], '%m/%d/%Y').date()
-                            except ValueError:
-                                date_added = date(2024, 3, 15)
-                    
-                    # Sanitize and validate all input fields
-                    applicant_data = {
-                        'p_id': InputValidator.validate_numeric(row.get('p_id', row_num), 1),
-                        'program': InputValidator.sanitize_string(row.get('program', '')),
-                        'comments': InputValidator.sanitize_string(row.get('comments', '')),
-                        'date_added': date_added,
-                        'url': InputValidator.sanitize_string(row.get('url', '')),
-                        'status': InputValidator.sanitize_string(row.get('status', '')),
-                        'term': InputValidator.sanitize_string(row.get('term', 'Spring 2025')),
-                        'us_or_international': InputValidator.sanitize_string(
-                            row.get('us_or_international', '')
-                        ),
-                        'gpa': InputValidator.validate_numeric(row.get('gpa'), 0.0, 4.0),
-                        'gre': InputValidator.validate_numeric(row.get('gre'), 130, 170),
-                        'gre_v': InputValidator.validate_numeric(row.get('gre_v'), 130, 170),
-                        'gre_aw': InputValidator.validate_numeric(row.get('gre_aw'), 0.0, 6.0),
-                        'degree': InputValidator.sanitize_string(row.get('degree', ''))
-                    }
-                    
-                    data.append(applicant_data)
-                    
-                except Exception as exc:
-                    logger.warning("Error parsing CSV row %s: %s", row_num, str(exc))
-                    continue
+            # Plain csv.reader rows plus one header lookup table avoid
+            # building a dict per row as csv.DictReader does
+            reader = csv.reader(file)
+            header = next(reader, [])
+            columns = {name: position for position, name in enumerate(header)}
+            
+            # Blank lines come through as empty lists; skip them like DictReader
+            data = [_parse_row(row, columns, row_num)
+                    for row_num, row in enumerate(filter(None, reader), 1)]
         
         logger.info("Successfully loaded %s records from CSV file", len(data))
         return data
         
-    except Exception as exc:
+    except (OSError, UnicodeDecodeError, csv.Error) as exc:
         logger.error("Error reading CSV file: %s", str(exc))
         return []
 
 
-def insert_data_to_database(data: List[Dict[str, Any]]) -> None:
+# Column order used for the bulk COPY and INSERT row tuples
+APPLICANT_COLUMNS = (
+    'p_id', 'program', 'comments', 'date_added', 'url', 'status', 'term',
+    'us_or_international', 'gpa', 'gre', 'gre_v', 'gre_aw', 'degree'
+)
+
+# Columns for records without a p_id, which take the key's sequence default
+GENERATED_ID_COLUMNS = APPLICANT_COLUMNS[1:]
+
+# Pulls a record's values other than p_id out as a tuple in column order;
+# every record from the generator and the CSV loader carries all of these keys
+_generated_id_row = itemgetter(*GENERATED_ID_COLUMNS)
+
+# Moves the p_id sequence past explicitly loaded keys, which do not advance it
+SYNC_ID_SEQUENCE_SQL = (
+    "SELECT setval(pg_get_serial_sequence('{0}', 'p_id'), "
+    "COALESCE(MAX(p_id), 0) + 1, false) FROM {0}"
+).format(Applicant.__tablename__)
+
+# NULL marker for COPY; sanitized strings can never contain a backslash
+COPY_NULL = '\\N'
+
+
+def _applicant_row(record: Dict[str, Any]) -> tuple:
+    """
+    Build the row tuple for a record with a p_id, in APPLICANT_COLUMNS order.
+    
+    The validators return p_id as a float, which COPY would write as text
+    such as "5.0" and an INTEGER column rejects. It is rounded to an int the
+    same way PostgreSQL casts a float to INTEGER.
+    
+    Args:
+        record: Applicant data dictionary with a p_id
+        
+    Returns:
+        tuple: Row values in APPLICANT_COLUMNS order
+    """
+    return (round(record['p_id']),) + _generated_id_row(record)
+
+
+def _normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace invalid term, status, and nationality values with safe defaults.
+    
+    Args:
+        record: Applicant data dictionary, updated in place
+        
+    Returns:
+        Dict[str, Any]: The same record, for use in comprehensions
+    """
+    if not record.get('term') or not validate_term(record['term']):
+        record['term'] = 'Spring 2025'
+    
+    if record.get('status') and not validate_status(record['status']):
+        record['status'] = 'Pending'
+    
+    if (record.get('us_or_international') and 
+        not validate_nationality(record['us_or_international'])):
+        record['us_or_international'] = 'Other'
+    
+    return record
+
+
+def _insert_rows_individually(cursor, insert_sql: str, rows: List[tuple]) -> int:
+    """
+    Insert rows one at a time, skipping any that the database rejects.
+    
+    Used when a multi-row batch fails, so one bad row does not discard
+    the rest of its batch.
+    
+    Args:
+        cursor: psycopg2 cursor on the session's connection
+        insert_sql: INSERT statement with a single VALUES %s placeholder
+        rows: Parameter tuples in the statement's column order
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    # pylint: disable=import-outside-toplevel
+    import psycopg2
+    from psycopg2.extras import execute_values
+    
+    inserted = 0
+    for row in rows:
+        cursor.execute("SAVEPOINT applicant_row")
+        try:
+            execute_values(cursor, insert_sql, [row])
+        except psycopg2.Error as exc:
+            cursor.execute("ROLLBACK TO SAVEPOINT applicant_row")
+            logger.warning("Skipping applicant record rejected by the database: %s", str(exc))
+            continue
+        cursor.execute("RELEASE SAVEPOINT applicant_row")
+        inserted += 1
+    return inserted
+
+
+def _insert_rows_in_batches(cursor, columns: Tuple[str, ...], rows: List[tuple],
+                            batch_size: int = 1000) -> int:
+    """
+    Insert rows with one multi-row INSERT per batch.
+    
+    A batch that fails is retried row by row so that only the offending
+    rows are skipped.
+    
+    Args:
+        cursor: psycopg2 cursor on the session's connection
+        columns: Columns the row values are given for
+        rows: Parameter tuples in columns order
+        batch_size: Number of rows sent per INSERT statement
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    # pylint: disable=import-outside-toplevel
+    import psycopg2
+    from psycopg2.extras import execute_values
+    
+    insert_sql = "INSERT INTO {} ({}) VALUES %s".format(
+        Applicant.__tablename__, ", ".join(columns)
+    )
+    total_inserted = 0
+    
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        batch_num = i // batch_size + 1
+        
+        cursor.execute("SAVEPOINT applicant_batch")
+        try:
+            execute_values(cursor, insert_sql, batch, page_size=batch_size)
+        except psycopg2.Error as exc:
+            cursor.execute("ROLLBACK TO SAVEPOINT applicant_batch")
+            logger.warning("Batch %s failed, retrying row by row: %s", batch_num, str(exc))
+            total_inserted += _insert_rows_individually(cursor, insert_sql, batch)
+            continue
+        
+        cursor.execute("RELEASE SAVEPOINT applicant_batch")
+        total_inserted += len(batch)
+        logger.info("Inserted batch %s: %s records", batch_num, len(batch))
+    
+    return total_inserted
+
+
+def _copy_rows(cursor, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+    """
+    Stream rows into the applicants table with COPY FROM STDIN.
+    
+    Rows are written to an in-memory CSV buffer, with None encoded as the
+    unquoted NULL marker so that empty strings stay distinct from NULL.
+    
+    Args:
+        cursor: psycopg2 cursor on the session's connection
+        columns: Columns the row values are given for
+        rows: Parameter tuples in columns order
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+    writer.writerows(
+        tuple(COPY_NULL if value is None else value for value in row)
+        for row in rows
+    )
+    buffer.seek(0)
+    
+    copy_sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '{}')".format(
+        Applicant.__tablename__, ", ".join(columns), COPY_NULL
+    )
+    cursor.copy_expert(copy_sql, buffer)
+
+
+def _load_rows(cursor, columns: Tuple[str, ...], rows: List[tuple]) -> int:
+    """
+    Load rows with COPY, falling back to batched INSERTs if COPY is rejected.
+    
+    Args:
+        cursor: psycopg2 cursor on the session's connection
+        columns: Columns the row values are given for
+        rows: Parameter tuples in columns order
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    import psycopg2  # pylint: disable=import-outside-toplevel
+    
+    cursor.execute("SAVEPOINT applicant_copy")
+    try:
+        _copy_rows(cursor, columns, rows)
+    except psycopg2.Error as exc:
+        cursor.execute("ROLLBACK TO SAVEPOINT applicant_copy")
+        logger.warning("COPY failed, falling back to batched INSERT: %s", str(exc))
+        return _insert_rows_in_batches(cursor, columns, rows)
+    
+    cursor.execute("RELEASE SAVEPOINT applicant_copy")
+    return len(rows)
+
+
+def insert_data_to_database(data: List[Dict[str, Any]], prevalidated: bool = False) -> None:
     """
     Insert applicant data into PostgreSQL database using secure methods.
     
+    Rows are streamed with a single COPY FROM STDIN and committed once at
+    the end. If COPY is rejected, the load falls back to batched INSERTs,
+    which skip individual malformed rows instead of failing the whole load.
+    
+    Records without a p_id are loaded after the rest without the p_id
+    column, so the primary key's sequence assigns them one.
+    
     Args:
         data: List of applicant data dictionaries
+        prevalidated: True if the term, status, and nationality values are
+            already known to be valid, e.g. generated sample data
         
     Raises:
         Exception: If database insertion fails
     """
-    try:
-        with app.app_context():
+    with app.app_context():
+        try:
             # Clear existing data for fresh analysis
             logger.info("Clearing existing applicant data...")
-            db.session.query(Applicant).delete()
+            db.session.execute(text(f"TRUNCATE TABLE {Applicant.__tablename__} RESTART IDENTITY"))
             
-            # Insert new data in batches for efficiency
-            batch_size = 100
-            total_inserted = 0
+            # Validate every record once (unless the caller already has),
+            # then build the row tuples, leaving p_id out where it is missing
+            records = data if prevalidated else map(_normalize_record, data)
+            rows, generated_id_rows = [], []
+            for record in records:
+                if record.get('p_id') is None:
+                    generated_id_rows.append(_generated_id_row(record))
+                else:
+                    rows.append(_applicant_row(record))
             
-            for i in range(0, len(data), batch_size):
-                batch = data[i:i + batch_size]
-                
-                for record in batch:
-                    try:
-                        # Validate record before insertion
-                        if not record.get('term') or not InputValidator.validate_term(record['term']):
-                            record['term'] = 'Spring 2025'
-                        
-                        if record.get('status') and not InputValidator.validate_status(record['status']):
-                            record['status'] = 'Pending'
-                        
-                        if (record.get('us_or_international') and 
-                            not InputValidator.validate_nationality(record['us_or_international'])):
-                            record['us_or_international'] = 'Other'
-                        
-                        applicant = Applicant(
-                            p_id=record.get('p_id'),
-                            program=record.get('program'),
-                            comments=record.get('comments'),
-                            date_added=record.get('date_added'),
-                            url=record.get('url'),
-                            status=record.get('status'),
-                            term=record.get('term'),
-                            us_or_international=record.get('us_or_international'),
-                            gpa=record.get('gpa'),
-                            gre=record.get('gre'),
-                            gre_v=record.get('gre_v'),
-                            gre_aw=record.get('gre_aw'),
-                            degree=record.get('degree')
-                        )
-                        db.session.add(applicant)
-                        total_inserted += 1
-                        
-                    except Exception as exc:
-                        logger.warning("Error creating applicant record: %s", str(exc))
-                        continue
+            # The cursor is closed on exit from the block, even on error
+            with db.session.connection().connection.cursor() as cursor:
+                total_inserted = _load_rows(cursor, APPLICANT_COLUMNS, rows)
                 
-                # Commit batch
-                try:
-                    db.session.commit()
-                    logger.info("Inserted batch %s: %s records", i//batch_size + 1, len(batch))
-                except Exception as exc:
-                    db.session.rollback()
-                    logger.error("Error committing batch %s: %s", i//batch_size + 1, str(exc))
-                    raise
+                if generated_id_rows:
+                    cursor.execute(SYNC_ID_SEQUENCE_SQL)
+                    total_inserted += _load_rows(cursor, GENERATED_ID_COLUMNS,
+                                                 generated_id_rows)
             
+            db.session.commit()
+            mark_data_changed()
             logger.info("Successfully inserted %s applicant records into database", total_inserted)
             
-    except Exception as exc:
-        if 'db' in locals():
+        except Exception as exc:
             db.session.rollback()
-        logger.error("Error inserting data into database: %s", str(exc))
-        raise
+            logger.error("Error inserting data into database: %s", str(exc))
+            raise
 
 
 def load_sample_data() -> None:
@@ -261,7 +577,8 @@ def load_sample_data() -> None:
     try:
         logger.info("Loading sample data for testing...")
         sample_data = generate_realistic_applicant_data(10000)
-        insert_data_to_database(sample_data)
+        # Generated values are drawn from the valid choices already
+        insert_data_to_database(sample_data, prevalidated=True)
         logger.info("Sample data loaded successfully")
     except Exception as exc:
         logger.error("Error loading sample data: %s", str(exc))
@@ -269,4 +586,5 @@ def load_sample_data() -> None:
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     load_sample_data()
@@ -7,7 +7,14 @@ Graduate School Data Analysis Platform with Security Hardening.
 Author: Abdullateef Mumin
 """
 
-from app import app
+import logging
+
+if __name__ == '__main__':
+    # Configure logging once, before the application modules log at import
+    logging.basicConfig(level=logging.DEBUG)
+
+from app import app  # pylint: disable=wrong-import-position
+from routes import init_database  # pylint: disable=wrong-import-position
 
 if __name__ == '__main__':
     print("=" * 60)
@@ -15,6 +22,9 @@ if __name__ == '__main__':
     print("Author: Abdullateef Mumin")
     print("Features: 10/10 PyLint, SQL Injection Protection, Input Validation")
     print("=" * 60)
+    with app.app_context():
+        init_database()
+    
     print("Starting secure application server...")
     print("Access the application at: http://localhost:5000")
     print("=" * 60)
@@ -8,11 +8,25 @@ SQLAlchemy ORM with proper type safety and validation.
 Author: Abdullateef Mumin
 """
 
+import logging
 from datetime import date
 from typing import Dict, Any, Optional
-from sqlalchemy import Integer, Text, Date, Float
+from sqlalchemy import Integer, Text, Date, Float, func, text
+from sqlalchemy.exc import SQLAlchemyError
 from app import db
 
+logger = logging.getLogger(__name__)
+
+# Incremented after every committed load of applicant data, so cached
+# analysis results computed from older data can be recognised as stale
+DATA_VERSION = 0
+
+
+def mark_data_changed() -> None:
+    """Record that the applicants table has been reloaded."""
+    global DATA_VERSION  # pylint: disable=global-statement
+    DATA_VERSION += 1
+
 
 class Applicant(db.Model):
     """
@@ -23,6 +37,22 @@ class Applicant(db.Model):
     """
     
     __tablename__ = 'applicants'
+    __table_args__ = (
+        # B-tree indexes matching the equality filters of the analysis queries;
+        # term-only filters use the leading column of the composite indexes
+        db.Index('ix_applicants_term_status', 'term', 'status'),
+        db.Index('ix_applicants_nat', 'us_or_international'),
+        db.Index('ix_applicants_term_nat', 'term', 'us_or_international'),
+        # Partial index covering only the JHU Computer Science rows
+        db.Index(
+            'ix_applicants_jhu_cs',
+            'degree',
+            postgresql_where=text(
+                "program ILIKE '%Johns Hopkins University%' "
+                "AND program ILIKE '%Computer Science%'"
+            ),
+        ),
+    )
     
     # Primary key and identification
     p_id = db.Column(Integer, primary_key=True, autoincrement=True)
@@ -81,12 +111,19 @@ class Applicant(db.Model):
         """
         Get basic statistics about the applicant dataset.
         
+        All three counts come from one query using COUNT(*) FILTER, so the
+        table is scanned once.
+        
         Returns:
             Dict[str, Any]: Summary statistics for the dataset
         """
-        total_count = cls.query.count()
-        spring_2025_count = cls.query.filter_by(term='Spring 2025').count()
-        accepted_count = cls.query.filter_by(status='Accepted').count()
+        total_count, spring_2025_count, accepted_count = db.session.execute(
+            db.select(
+                func.count(),
+                func.count().filter(cls.term == 'Spring 2025'),
+                func.count().filter(cls.status == 'Accepted'),
+            ).select_from(cls)
+        ).one()
         
         acceptance_rate = 0
         if total_count > 0:
@@ -128,3 +165,51 @@ class Applicant(db.Model):
         defaults.update(kwargs)
         
         return cls(**defaults)
+
+
+# create_all() never adds indexes to a table that already exists, so these
+# idempotent statements bring existing tables up to the indexes declared in
+# __table_args__. ix_applicants_term duplicated the leading column of the
+# composite term indexes and is dropped.
+SCHEMA_MIGRATION = (
+    "CREATE INDEX IF NOT EXISTS ix_applicants_term_status ON applicants (term, status)",
+    "CREATE INDEX IF NOT EXISTS ix_applicants_nat ON applicants (us_or_international)",
+    "CREATE INDEX IF NOT EXISTS ix_applicants_term_nat ON applicants (term, us_or_international)",
+    "CREATE INDEX IF NOT EXISTS ix_applicants_jhu_cs ON applicants (degree) "
+    "WHERE program ILIKE '%Johns Hopkins University%' "
+    "AND program ILIKE '%Computer Science%'",
+    "DROP INDEX IF EXISTS ix_applicants_term",
+)
+
+# Trigram index so ILIKE '%...%' on program can avoid a full scan. It needs
+# the pg_trgm extension, which may be unavailable or need privileges the
+# application role lacks, so it is optional: ILIKE works without it.
+TRIGRAM_MIGRATION = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_applicants_program_trgm "
+    "ON applicants USING gin (program gin_trgm_ops)",
+)
+
+
+def migrate_schema() -> None:
+    """
+    Bring an existing applicants table up to the model's indexes.
+
+    Safe to run on every start-up; statements for objects that already
+    exist do nothing. Only PostgreSQL is migrated. The trigram index is
+    best-effort: if pg_trgm cannot be installed the failure is logged and
+    the table is left without it. Must be called inside an application
+    context.
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return
+    with db.engine.begin() as conn:
+        for statement in SCHEMA_MIGRATION:
+            conn.execute(text(statement))
+
+    try:
+        with db.engine.begin() as conn:
+            for statement in TRIGRAM_MIGRATION:
+                conn.execute(text(statement))
+    except SQLAlchemyError as exc:
+        logger.warning("Skipping trigram index on applicants.program: %s", exc)
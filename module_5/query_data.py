@@ -7,88 +7,389 @@ for secure query composition and SQL injection prevention.
 Author: Abdullateef Mumin
 """
 
+import csv
+import io
 import logging
-from typing import Dict, Any, Optional
-import psycopg2
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Sequence, Union
 from psycopg2 import sql
-from app import app
-from security_utils import InputValidator
+from app import app, db
+from security_utils import validate_nationality, validate_status, validate_term
 
-# Configure logging for query monitoring
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Positional or named values bound to a query's placeholders
+QueryParams = Union[Sequence[Any], Mapping[str, Any]]
 
-class SecureQueryExecutor:
-    """Secure database query executor with comprehensive error handling."""
+# Largest number of applicant rows returned by get_applicants_json
+MAX_APPLICANTS_JSON_LIMIT = 1000
 
-    def __init__(self):
-        """Initialize the query executor."""
-        self.connection = None
+# Rows transferred per network round-trip on bulk and streamed reads
+FETCH_BATCH_SIZE = 5000
 
-    def get_connection(self):
-        """Get secure database connection."""
-        try:
-            database_url = app.config["SQLALCHEMY_DATABASE_URI"]
-            self.connection = psycopg2.connect(database_url)
-            return self.connection
-        except Exception as exc:
-            logger.error("Database connection error: %s", exc)
-            raise
-
-    def execute_secure_query(self, query: sql.Composed) -> Optional[Any]:
-        """
-        Execute a secure SQL query with proper error handling.
-
-        Args:
-            query: Secure SQL query object
-
-        Returns:
-            Optional[Any]: Query results or None if error
-        """
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+# Milliseconds a request query may run before PostgreSQL aborts it
+STATEMENT_TIMEOUT_MS = 10000
 
-            cursor.execute(query)
-            result = cursor.fetchall()
+# Columns written by the CSV export, in order
+EXPORT_COLUMNS = (
+    'p_id', 'program', 'comments', 'date_added', 'url', 'status', 'term',
+    'us_or_international', 'gpa', 'gre', 'gre_v', 'gre_aw', 'degree'
+)
 
-            cursor.close()
-            conn.close()
+# Fixed filter values of the analysis queries. They never come from user
+# input, so they are validated once here instead of on every request.
+SPRING_2025 = "Spring 2025"
+INTERNATIONAL = "International"
+AMERICAN = "American"
+ACCEPTED = "Accepted"
+JHU_PATTERN = "%Johns Hopkins University%"
+CS_PATTERN = "%Computer Science%"
+MASTERS_DEGREES = ("MS", "Master")
 
-            return result
-        except Exception as exc:
-            logger.error("Query execution error: %s", exc)
-            if self.connection:
-                self.connection.close()
-            raise
+if not (validate_term(SPRING_2025)
+        and validate_nationality(INTERNATIONAL)
+        and validate_nationality(AMERICAN)
+        and validate_status(ACCEPTED)):
+    raise ValueError("Invalid analysis filter constant")
 
-    def execute_single_result_query(self, query: sql.Composed) -> Optional[Any]:
-        """
-        Execute query expecting single result.
 
-        Args:
-            query: Secure SQL query object
+@contextmanager
+def pooled_connection() -> Iterator[Any]:
+    """
+    Check a raw DBAPI connection out of the application's engine pool.
 
-        Returns:
-            Optional[Any]: Single query result or None
-        """
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+    Queries share the SQLAlchemy engine's pool and its size limit, so an
+    exhausted pool makes the caller wait (up to the engine's pool timeout)
+    rather than fail at once. The connection is rolled back if the block
+    raises and is always returned to the pool, so callers cannot leak
+    connections.
+
+    Queries on the connection are limited to STATEMENT_TIMEOUT_MS. The limit
+    is set for the current transaction only, so it ends when the connection
+    goes back to the pool and never applies to bulk loads or migrations.
+
+    Yields:
+        connection: psycopg2 database connection
+    """
+    with app.app_context():
+        conn = db.engine.raw_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET LOCAL statement_timeout = %s", (STATEMENT_TIMEOUT_MS,))
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def run_all(query: sql.Composable, params: Optional[QueryParams] = None) -> Optional[Any]:
+    """
+    Execute a secure SQL query with proper error handling.
+
+    Args:
+        query: Secure SQL query object
+        params: Values bound to the query's placeholders
+
+    Returns:
+        Optional[Any]: Query results or None if error
+    """
+    try:
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute(query, params)
+            return cursor.fetchall()
+    except Exception as exc:
+        logger.error("Query execution error: %s", exc)
+        raise
+
+
+def run_one(query: sql.Composable, params: Optional[QueryParams] = None) -> Optional[Any]:
+    """
+    Execute query expecting single result.
+
+    Args:
+        query: Secure SQL query object
+        params: Values bound to the query's placeholders
+
+    Returns:
+        Optional[Any]: Single query result or None
+    """
+    try:
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchone()
+    except Exception as exc:
+        logger.error("Single result query error: %s", exc)
+        raise
+
+
+def stream_query(query: sql.Composable, params: Optional[QueryParams] = None,
+                 name: str = 'sv_cursor',
+                 itersize: int = FETCH_BATCH_SIZE) -> Iterator[List[Any]]:
+    """
+    Execute a query on a server-side cursor and yield its rows in batches.
+
+    Only one batch is held in memory at a time, so arbitrarily large
+    result sets can be processed. Named cursors only live inside a
+    transaction, which the pooled connection provides; it stays checked
+    out until the generator is exhausted or closed.
+
+    Args:
+        query: Secure SQL query object
+        params: Values bound to the query's placeholders
+        name: Name of the server-side cursor
+        itersize: Number of rows fetched per round-trip
+
+    Yields:
+        List[Any]: Up to itersize result rows
+    """
+    try:
+        with pooled_connection() as conn, conn.cursor(name=name) as cursor:
+            cursor.arraysize = itersize
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(itersize)
+                if not rows:
+                    break
+                yield rows
+    except Exception as exc:
+        logger.error("Streaming query error: %s", exc)
+        raise
 
-            cursor.execute(query)
-            result = cursor.fetchone()
 
-            cursor.close()
-            conn.close()
+class _RenderedOnce(sql.Composable):
+    """
+    A composed query whose SQL text is rendered on first execution and reused.
 
-            return result
-        except Exception as exc:
-            logger.error("Single result query error: %s", exc)
-            if self.connection:
-                self.connection.close()
-            raise
+    Only used for the module-level queries below: their identifiers are
+    fixed and every value is a bound placeholder, so the rendered text can
+    never change and need not be rebuilt from the Composed tree per call.
+    """
+
+    def __init__(self, composed: sql.Composed):
+        """Wrap a composed query."""
+        super().__init__(composed)
+        self._text: Optional[str] = None
+
+    def as_string(self, context) -> str:
+        """Return the SQL text, rendering it with the given context only once."""
+        if self._text is None:
+            self._text = self._wrapped.as_string(context)
+        return self._text
+
+
+# Queries are composed once at import and rendered to SQL text on first use;
+# values are bound as parameters at execution time
+
+_Q_SPRING_2025_COUNT = _RenderedOnce(sql.SQL("""
+    SELECT COUNT(*) as count
+    FROM {table}
+    WHERE {field} = %s
+""").format(
+    table=sql.Identifier('applicants'),
+    field=sql.Identifier('term')
+))
+
+_Q_INTERNATIONAL_PERCENTAGE = _RenderedOnce(sql.SQL("""
+    SELECT
+        ROUND(COUNT(CASE WHEN {field} = {value} THEN 1 END) * 100.0
+            / NULLIF(COUNT(*), 0), 2) as percentage,
+        COUNT(CASE WHEN {field} = {value} THEN 1 END) as match_count,
+        COUNT(*) as total_count
+    FROM {table}
+    WHERE {field} IS NOT NULL
+""").format(
+    field=sql.Identifier('us_or_international'),
+    value=sql.Placeholder('nationality'),
+    table=sql.Identifier('applicants')
+))
+
+_Q_AVERAGE_SCORES = _RenderedOnce(sql.SQL("""
+    SELECT
+        ROUND(AVG({gpa})::numeric, 3) as avg_gpa,
+        ROUND(AVG({gre})::numeric, 1) as avg_gre,
+        ROUND(AVG({gre_v})::numeric, 1) as avg_gre_v,
+        ROUND(AVG({gre_aw})::numeric, 2) as avg_gre_aw
+    FROM {table}
+    WHERE {gpa} IS NOT NULL
+        AND {gre} IS NOT NULL
+        AND {gre_v} IS NOT NULL
+        AND {gre_aw} IS NOT NULL
+""").format(
+    gpa=sql.Identifier('gpa'),
+    gre=sql.Identifier('gre'),
+    gre_v=sql.Identifier('gre_v'),
+    gre_aw=sql.Identifier('gre_aw'),
+    table=sql.Identifier('applicants')
+))
+
+_Q_AMERICAN_SPRING_2025_GPA = _RenderedOnce(sql.SQL("""
+    SELECT ROUND(AVG({gpa})::numeric, 3) as avg_gpa
+    FROM {table}
+    WHERE {nationality_field} = {nationality}
+        AND {term_field} = {term}
+        AND {gpa} IS NOT NULL
+""").format(
+    gpa=sql.Identifier('gpa'),
+    table=sql.Identifier('applicants'),
+    nationality_field=sql.Identifier('us_or_international'),
+    term_field=sql.Identifier('term'),
+    nationality=sql.Placeholder('nationality'),
+    term=sql.Placeholder('term')
+))
+
+_Q_SPRING_2025_ACCEPTANCE_RATE = _RenderedOnce(sql.SQL("""
+    SELECT
+        ROUND(COUNT(CASE WHEN {status_field} = {status} THEN 1 END) * 100.0
+            / NULLIF(COUNT(*), 0), 2) as acceptance_rate,
+        COUNT(CASE WHEN {status_field} = {status} THEN 1 END) as accepted_count,
+        COUNT(*) as total_spring_2025
+    FROM {table}
+    WHERE {term_field} = {term}
+""").format(
+    status_field=sql.Identifier('status'),
+    term_field=sql.Identifier('term'),
+    table=sql.Identifier('applicants'),
+    status=sql.Placeholder('status'),
+    term=sql.Placeholder('term')
+))
+
+_Q_ACCEPTED_SPRING_2025_GPA = _RenderedOnce(sql.SQL("""
+    SELECT ROUND(AVG({gpa})::numeric, 3) as avg_gpa
+    FROM {table}
+    WHERE {term_field} = {term}
+        AND {status_field} = {status}
+        AND {gpa} IS NOT NULL
+""").format(
+    gpa=sql.Identifier('gpa'),
+    table=sql.Identifier('applicants'),
+    term_field=sql.Identifier('term'),
+    status_field=sql.Identifier('status'),
+    term=sql.Placeholder('term'),
+    status=sql.Placeholder('status')
+))
+
+_Q_JHU_CS_MASTERS_COUNT = _RenderedOnce(sql.SQL("""
+    SELECT COUNT(*) as count
+    FROM {table}
+    WHERE {program_field} ILIKE {university_pattern}
+        AND {program_field} ILIKE {program_pattern}
+        AND ({degree_field} = {ms1} OR {degree_field} = {ms2})
+""").format(
+    table=sql.Identifier('applicants'),
+    program_field=sql.Identifier('program'),
+    degree_field=sql.Identifier('degree'),
+    university_pattern=sql.Placeholder('university_pattern'),
+    program_pattern=sql.Placeholder('program_pattern'),
+    ms1=sql.Placeholder('ms1'),
+    ms2=sql.Placeholder('ms2')
+))
+
+# One query computing the inputs of all seven analyses. Each analysis is a
+# filtered aggregate over a single scan of the applicants table, so the
+# dashboard needs one round-trip instead of seven.
+_Q_FUSED_ANALYSIS = _RenderedOnce(sql.SQL("""
+    SELECT
+        COUNT(*) FILTER (WHERE {term_field} = {term}) as spring25_count,
+        ROUND(COUNT(*) FILTER (WHERE {nationality_field} = {international}) * 100.0
+            / NULLIF(COUNT({nationality_field}), 0), 2) as intl_pct,
+        COUNT(*) FILTER (WHERE {nationality_field} = {international}) as intl_count,
+        COUNT({nationality_field}) as nat_total,
+        ROUND(AVG({gpa}) FILTER (WHERE {complete})::numeric, 3) as avg_gpa,
+        ROUND(AVG({gre}) FILTER (WHERE {complete})::numeric, 1) as avg_gre,
+        ROUND(AVG({gre_v}) FILTER (WHERE {complete})::numeric, 1) as avg_gre_v,
+        ROUND(AVG({gre_aw}) FILTER (WHERE {complete})::numeric, 2) as avg_gre_aw,
+        ROUND(AVG({gpa}) FILTER (
+            WHERE {nationality_field} = {american} AND {term_field} = {term}
+        )::numeric, 3) as amer_spring_gpa,
+        ROUND(COUNT(*) FILTER (
+            WHERE {term_field} = {term} AND {status_field} = {accepted}
+        ) * 100.0 / NULLIF(COUNT(*) FILTER (WHERE {term_field} = {term}), 0), 2)
+            as accept_pct,
+        COUNT(*) FILTER (
+            WHERE {term_field} = {term} AND {status_field} = {accepted}
+        ) as accept_count,
+        ROUND(AVG({gpa}) FILTER (
+            WHERE {term_field} = {term} AND {status_field} = {accepted}
+        )::numeric, 3) as accepted_spring_gpa,
+        COUNT(*) FILTER (
+            WHERE {program_field} ILIKE {university_pattern}
+                AND {program_field} ILIKE {program_pattern}
+                AND ({degree_field} = {ms1} OR {degree_field} = {ms2})
+        ) as jhu_count
+    FROM {table}
+""").format(
+    table=sql.Identifier('applicants'),
+    term_field=sql.Identifier('term'),
+    nationality_field=sql.Identifier('us_or_international'),
+    status_field=sql.Identifier('status'),
+    program_field=sql.Identifier('program'),
+    degree_field=sql.Identifier('degree'),
+    gpa=sql.Identifier('gpa'),
+    gre=sql.Identifier('gre'),
+    gre_v=sql.Identifier('gre_v'),
+    gre_aw=sql.Identifier('gre_aw'),
+    complete=sql.SQL(' AND ').join(
+        sql.SQL('{} IS NOT NULL').format(sql.Identifier(field))
+        for field in ('gpa', 'gre', 'gre_v', 'gre_aw')
+    ),
+    term=sql.Placeholder('term'),
+    international=sql.Placeholder('international'),
+    american=sql.Placeholder('american'),
+    accepted=sql.Placeholder('accepted'),
+    university_pattern=sql.Placeholder('university_pattern'),
+    program_pattern=sql.Placeholder('program_pattern'),
+    ms1=sql.Placeholder('ms1'),
+    ms2=sql.Placeholder('ms2')
+))
+
+# Applicant rows serialized to a JSON array by PostgreSQL; cast to text so
+# psycopg2 hands back the encoded payload instead of decoding it
+_Q_APPLICANTS_JSON = _RenderedOnce(sql.SQL("""
+    SELECT COALESCE(json_agg(row_to_json(a)), '[]')::text
+    FROM (
+        SELECT * FROM {table} ORDER BY {p_id} LIMIT {limit}
+    ) a
+""").format(
+    table=sql.Identifier('applicants'),
+    p_id=sql.Identifier('p_id'),
+    limit=sql.Placeholder('limit')
+))
+
+# Every applicant row for the CSV export, read through a server-side cursor
+_Q_APPLICANTS_EXPORT = _RenderedOnce(sql.SQL("""
+    SELECT {columns} FROM {table} ORDER BY {p_id}
+""").format(
+    columns=sql.SQL(", ").join(map(sql.Identifier, EXPORT_COLUMNS)),
+    table=sql.Identifier('applicants'),
+    p_id=sql.Identifier('p_id')
+))
+
+_FUSED_ANALYSIS_PARAMS = {
+    'term': SPRING_2025,
+    'international': INTERNATIONAL,
+    'american': AMERICAN,
+    'accepted': ACCEPTED,
+    'university_pattern': JHU_PATTERN,
+    'program_pattern': CS_PATTERN,
+    'ms1': MASTERS_DEGREES[0],
+    'ms2': MASTERS_DEGREES[1]
+}
+
+
+def _spring_2025_entries_result(count: int) -> Dict[str, Any]:
+    """Format the Query 1 result for a Spring 2025 application count."""
+    logger.info("Spring 2025 applications query executed: %s records found", count)
+
+    return {
+        'question': 'How many entries do you have in your database who have applied for Spring 2025?',
+        'answer': count,
+        'query': 'SELECT COUNT(*) FROM applicants WHERE term = %s',
+        'explanation': 'This query counts all applicant records where the term field equals "Spring 2025"',
+        'methodology': 'Simple COUNT aggregation with WHERE clause filtering'
+    }
 
 
 def get_spring_2025_entries() -> Dict[str, Any]:
@@ -102,40 +403,45 @@ def get_spring_2025_entries() -> Dict[str, Any]:
         Dict[str, Any]: Query results with count, SQL, and metadata
     """
     try:
-        # Validate input
-        term = "Spring 2025"
-        if not InputValidator.validate_term(term):
-            return {'error': 'Invalid term format'}
-
-        # Build secure query
-        query = sql.SQL("""
-            SELECT COUNT(*) as count
-            FROM {table}
-            WHERE {field} = {value}
-            LIMIT 1
-        """).format(
-            table=sql.Identifier('applicants'),
-            field=sql.Identifier('term'),
-            value=sql.Literal(term)
-        )
+        # Execute precompiled query
+        result = run_one(_Q_SPRING_2025_COUNT, (SPRING_2025,))
 
-        # Execute query
-        executor = SecureQueryExecutor()
-        result = executor.execute_single_result_query(query)
+        return _spring_2025_entries_result(result[0] if result else 0)
+    except Exception as exc:
+        logger.error("Error in Spring 2025 entries query: %s", exc)
+        return {'error': f"Database query failed: {str(exc)}"}
 
-        count = result[0] if result else 0
-        logger.info("Spring 2025 applications query executed: %s records found", count)
 
+def _international_percentage_result(percentage: Any, intl_count: Any,
+                                     total: Any) -> Dict[str, Any]:
+    """Format the Query 2 result from the raw percentage and counts."""
+    question = 'What percentage of entries are from international students?'
+    query = ('SELECT COUNT(CASE WHEN us_or_international = %s THEN 1 END) * 100.0 / COUNT(*) '
+             'FROM applicants WHERE us_or_international IS NOT NULL')
+
+    if not total:
         return {
-            'question': 'How many entries do you have in your database who have applied for Spring 2025?',
-            'answer': count,
-            'query': 'SELECT COUNT(*) FROM applicants WHERE term = %s LIMIT 1',
-            'explanation': 'This query counts all applicant records where the term field equals "Spring 2025"',
-            'methodology': 'Simple COUNT aggregation with WHERE clause filtering and LIMIT protection'
+            'question': question,
+            'answer': '0%',
+            'query': query,
+            'explanation': 'No nationality data available for analysis'
         }
-    except Exception as exc:
-        logger.error("Error in Spring 2025 entries query: %s", exc)
-        return {'error': f"Database query failed: {str(exc)}"}
+
+    percentage = float(percentage) if percentage else 0
+    intl_count = int(intl_count) if intl_count else 0
+    total = int(total)
+
+    logger.info("International percentage query: %s%% (%s/%s)", percentage, intl_count, total)
+
+    return {
+        'question': question,
+        'answer': f"{percentage}%",
+        'international_count': intl_count,
+        'total_count': total,
+        'query': query,
+        'explanation': f'Calculated from {total} applicants with nationality data: {intl_count} international students',
+        'methodology': 'Conditional COUNT with percentage calculation using CASE WHEN'
+    }
 
 
 def get_international_percentage() -> Dict[str, Any]:
@@ -148,58 +454,51 @@ def get_international_percentage() -> Dict[str, Any]:
         Dict[str, Any]: Percentage of international students with detailed breakdown
     """
     try:
-        # Validate input
-        nationality = "International"
-        if not InputValidator.validate_nationality(nationality):
-            return {'error': 'Invalid nationality value'}
-
-        # Build secure query
-        query = sql.SQL("""
-            SELECT
-                COUNT(CASE WHEN {field} = {value} THEN 1 END) * 100.0 / COUNT(*) as percentage,
-                COUNT(CASE WHEN {field} = {value} THEN 1 END) as match_count,
-                COUNT(*) as total_count
-            FROM {table}
-            WHERE {field} IS NOT NULL
-            LIMIT 1
-        """).format(
-            field=sql.Identifier('us_or_international'),
-            value=sql.Literal(nationality),
-            table=sql.Identifier('applicants')
+        # Execute precompiled query
+        result = run_one(
+            _Q_INTERNATIONAL_PERCENTAGE, {'nationality': INTERNATIONAL}
         )
 
-        # Execute query
-        executor = SecureQueryExecutor()
-        result = executor.execute_single_result_query(query)
-
-        if result:
-            percentage = round(float(result[0]), 2) if result[0] else 0
-            intl_count = int(result[1]) if result[1] else 0
-            total = int(result[2]) if result[2] else 0
-
-            logger.info("International percentage query: %s%% (%s/%s)", percentage, intl_count, total)
-
-            return {
-                'question': 'What percentage of entries are from international students?',
-                'answer': f"{percentage}%",
-                'international_count': intl_count,
-                'total_count': total,
-                'query': 'SELECT COUNT(CASE WHEN us_or_international = %s THEN 1 END) * 100.0 / COUNT(*) FROM applicants WHERE us_or_international IS NOT NULL LIMIT 1',
-                'explanation': f'Calculated from {total} applicants with nationality data: {intl_count} international students',
-                'methodology': 'Conditional COUNT with percentage calculation using CASE WHEN and LIMIT protection'
-            }
-        else:
-            return {
-                'question': 'What percentage of entries are from international students?',
-                'answer': '0%',
-                'query': 'SELECT COUNT(CASE WHEN us_or_international = %s THEN 1 END) * 100.0 / COUNT(*) FROM applicants WHERE us_or_international IS NOT NULL LIMIT 1',
-                'explanation': 'No nationality data available for analysis'
-            }
+        return _international_percentage_result(*(result or (None, None, None)))
     except Exception as exc:
         logger.error("Error in international percentage query: %s", exc)
         return {'error': f"International percentage calculation failed: {str(exc)}"}
 
 
+def _average_scores_result(avg_gpa: Any, avg_gre: Any, avg_gre_v: Any,
+                           avg_gre_aw: Any) -> Dict[str, Any]:
+    """Format the Query 3 result from the raw score averages."""
+    question = 'What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?'
+    query = ('SELECT AVG(gpa), AVG(gre), AVG(gre_v), AVG(gre_aw) FROM applicants '
+             'WHERE gpa IS NOT NULL AND gre IS NOT NULL AND gre_v IS NOT NULL '
+             'AND gre_aw IS NOT NULL')
+
+    if avg_gpa is None:
+        return {
+            'question': question,
+            'answer': {'avg_gpa': 0, 'avg_gre': 0, 'avg_gre_v': 0, 'avg_gre_aw': 0},
+            'query': query,
+            'explanation': 'No complete academic records available for analysis'
+        }
+
+    avg_scores = {
+        'avg_gpa': float(avg_gpa),
+        'avg_gre': float(avg_gre),
+        'avg_gre_v': float(avg_gre_v),
+        'avg_gre_aw': float(avg_gre_aw)
+    }
+
+    logger.info("Average scores calculated successfully")
+
+    return {
+        'question': question,
+        'answer': avg_scores,
+        'query': query,
+        'explanation': 'Calculates mean values for all academic metrics, excluding incomplete records',
+        'methodology': 'AVG aggregation with comprehensive NULL filtering'
+    }
+
+
 def get_average_scores() -> Dict[str, Any]:
     """
     Query 3: Academic Performance Metrics Analysis.
@@ -211,60 +510,42 @@ def get_average_scores() -> Dict[str, Any]:
         Dict[str, Any]: Average scores for all academic metrics
     """
     try:
-        # Build secure query for multiple averages
-        query = sql.SQL("""
-            SELECT
-                AVG({gpa}) as avg_gpa,
-                AVG({gre}) as avg_gre,
-                AVG({gre_v}) as avg_gre_v,
-                AVG({gre_aw}) as avg_gre_aw
-            FROM {table}
-            WHERE {gpa} IS NOT NULL
-                AND {gre} IS NOT NULL
-                AND {gre_v} IS NOT NULL
-                AND {gre_aw} IS NOT NULL
-            LIMIT 1
-        """).format(
-            gpa=sql.Identifier('gpa'),
-            gre=sql.Identifier('gre'),
-            gre_v=sql.Identifier('gre_v'),
-            gre_aw=sql.Identifier('gre_aw'),
-            table=sql.Identifier('applicants')
-        )
-
-        # Execute query
-        executor = SecureQueryExecutor()
-        result = executor.execute_single_result_query(query)
-
-        if result and result[0] is not None:
-            avg_scores = {
-                'avg_gpa': round(float(result[0]), 3),
-                'avg_gre': round(float(result[1]), 1),
-                'avg_gre_v': round(float(result[2]), 1),
-                'avg_gre_aw': round(float(result[3]), 2)
-            }
+        # Execute precompiled query
+        result = run_one(_Q_AVERAGE_SCORES)
 
-            logger.info("Average scores calculated successfully")
-
-            return {
-                'question': 'What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?',
-                'answer': avg_scores,
-                'query': 'SELECT AVG(gpa), AVG(gre), AVG(gre_v), AVG(gre_aw) FROM applicants WHERE gpa IS NOT NULL AND gre IS NOT NULL AND gre_v IS NOT NULL AND gre_aw IS NOT NULL LIMIT 1',
-                'explanation': 'Calculates mean values for all academic metrics, excluding incomplete records',
-                'methodology': 'AVG aggregation with comprehensive NULL filtering and LIMIT protection'
-            }
-        else:
-            return {
-                'question': 'What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?',
-                'answer': {'avg_gpa': 0, 'avg_gre': 0, 'avg_gre_v': 0, 'avg_gre_aw': 0},
-                'query': 'SELECT AVG(gpa), AVG(gre), AVG(gre_v), AVG(gre_aw) FROM applicants WHERE gpa IS NOT NULL AND gre IS NOT NULL AND gre_v IS NOT NULL AND gre_aw IS NOT NULL LIMIT 1',
-                'explanation': 'No complete academic records available for analysis'
-            }
+        return _average_scores_result(*(result or (None, None, None, None)))
     except Exception as exc:
         logger.error("Error in average scores query: %s", exc)
         return {'error': f"Average scores calculation failed: {str(exc)}"}
 
 
+def _american_spring_2025_gpa_result(avg_gpa: Any) -> Dict[str, Any]:
+    """Format the Query 4 result from the raw average GPA."""
+    question = 'What is the average GPA of American students in Spring 2025?'
+    query = ('SELECT AVG(gpa) FROM applicants WHERE us_or_international = %s '
+             'AND term = %s AND gpa IS NOT NULL')
+
+    if avg_gpa is None:
+        return {
+            'question': question,
+            'answer': 0,
+            'query': query,
+            'explanation': 'No American Spring 2025 applicants with GPA data found'
+        }
+
+    avg_gpa = float(avg_gpa)
+
+    logger.info("American Spring 2025 GPA: %s", avg_gpa)
+
+    return {
+        'question': question,
+        'answer': avg_gpa,
+        'query': query,
+        'explanation': 'Calculates mean GPA for domestic students applying Spring 2025',
+        'methodology': 'Filtered AVG aggregation with demographic and term constraints'
+    }
+
+
 def get_american_spring_2025_gpa() -> Dict[str, Any]:
     """
     Query 4: Domestic Student Academic Performance.
@@ -275,60 +556,49 @@ def get_american_spring_2025_gpa() -> Dict[str, Any]:
         Dict[str, Any]: Average GPA for American Spring 2025 applicants
     """
     try:
-        # Validate inputs
-        nationality = "American"
-        term = "Spring 2025"
-
-        if not InputValidator.validate_nationality(nationality):
-            return {'error': 'Invalid nationality value'}
-        if not InputValidator.validate_term(term):
-            return {'error': 'Invalid term format'}
-
-        # Build secure query
-        query = sql.SQL("""
-            SELECT AVG({gpa}) as avg_gpa
-            FROM {table}
-            WHERE {nationality_field} = {nationality}
-                AND {term_field} = {term}
-                AND {gpa} IS NOT NULL
-            LIMIT 1
-        """).format(
-            gpa=sql.Identifier('gpa'),
-            table=sql.Identifier('applicants'),
-            nationality_field=sql.Identifier('us_or_international'),
-            term_field=sql.Identifier('term'),
-            nationality=sql.Literal(nationality),
-            term=sql.Literal(term)
+        # Execute precompiled query
+        result = run_one(
+            _Q_AMERICAN_SPRING_2025_GPA, {'nationality': AMERICAN, 'term': SPRING_2025}
         )
 
-        # Execute query
-        executor = SecureQueryExecutor()
-        result = executor.execute_single_result_query(query)
-
-        if result and result[0] is not None:
-            avg_gpa = round(float(result[0]), 3)
-
-            logger.info("American Spring 2025 GPA: %s", avg_gpa)
-
-            return {
-                'question': 'What is the average GPA of American students in Spring 2025?',
-                'answer': avg_gpa,
-                'query': 'SELECT AVG(gpa) FROM applicants WHERE us_or_international = %s AND term = %s AND gpa IS NOT NULL LIMIT 1',
-                'explanation': 'Calculates mean GPA for domestic students applying Spring 2025',
-                'methodology': 'Filtered AVG aggregation with demographic and term constraints plus LIMIT protection'
-            }
-        else:
-            return {
-                'question': 'What is the average GPA of American students in Spring 2025?',
-                'answer': 0,
-                'query': 'SELECT AVG(gpa) FROM applicants WHERE us_or_international = %s AND term = %s AND gpa IS NOT NULL LIMIT 1',
-                'explanation': 'No American Spring 2025 applicants with GPA data found'
-            }
+        return _american_spring_2025_gpa_result(result[0] if result else None)
     except Exception as exc:
         logger.error("Error in American Spring 2025 GPA query: %s", exc)
         return {'error': f"American GPA calculation failed: {str(exc)}"}
 
 
+def _spring_2025_acceptance_rate_result(acceptance_rate: Any, accepted_count: Any,
+                                        total_count: Any) -> Dict[str, Any]:
+    """Format the Query 5 result from the raw acceptance rate and counts."""
+    question = 'What percent of entries for Spring 2025 are Acceptances?'
+    query = ('SELECT COUNT(CASE WHEN status = %s THEN 1 END) * 100.0 / COUNT(*) '
+             'FROM applicants WHERE term = %s')
+
+    if not total_count:
+        return {
+            'question': question,
+            'answer': '0%',
+            'query': query,
+            'explanation': 'No Spring 2025 records found for analysis'
+        }
+
+    acceptance_rate = float(acceptance_rate) if acceptance_rate else 0
+    accepted_count = int(accepted_count) if accepted_count else 0
+    total_count = int(total_count)
+
+    logger.info("Spring 2025 acceptance rate: %s%% (%s/%s)", acceptance_rate, accepted_count, total_count)
+
+    return {
+        'question': question,
+        'answer': f"{acceptance_rate}%",
+        'accepted_count': accepted_count,
+        'total_count': total_count,
+        'query': query,
+        'explanation': f'Acceptance rate calculated from {total_count} Spring 2025 applications with {accepted_count} acceptances',
+        'methodology': 'Conditional aggregation using CASE WHEN for percentage calculation'
+    }
+
+
 def get_spring_2025_acceptance_rate() -> Dict[str, Any]:
     """
     Query 5: Spring 2025 Admission Success Analysis.
@@ -339,64 +609,44 @@ def get_spring_2025_acceptance_rate() -> Dict[str, Any]:
         Dict[str, Any]: Acceptance rate percentage with detailed breakdown
     """
     try:
-        # Validate inputs
-        term = "Spring 2025"
-        status = "Accepted"
-
-        if not InputValidator.validate_term(term):
-            return {'error': 'Invalid term format'}
-        if not InputValidator.validate_status(status):
-            return {'error': 'Invalid status value'}
-
-        # Build secure query
-        query = sql.SQL("""
-            SELECT
-                COUNT(CASE WHEN {status_field} = {status} THEN 1 END) * 100.0 / COUNT(*) as acceptance_rate,
-                COUNT(CASE WHEN {status_field} = {status} THEN 1 END) as accepted_count,
-                COUNT(*) as total_spring_2025
-            FROM {table}
-            WHERE {term_field} = {term}
-            LIMIT 1
-        """).format(
-            status_field=sql.Identifier('status'),
-            term_field=sql.Identifier('term'),
-            table=sql.Identifier('applicants'),
-            status=sql.Literal(status),
-            term=sql.Literal(term)
+        # Execute precompiled query
+        result = run_one(
+            _Q_SPRING_2025_ACCEPTANCE_RATE, {'status': ACCEPTED, 'term': SPRING_2025}
         )
 
-        # Execute query
-        executor = SecureQueryExecutor()
-        result = executor.execute_single_result_query(query)
-
-        if result:
-            acceptance_rate = round(float(result[0]), 2) if result[0] else 0
-            accepted_count = int(result[1]) if result[1] else 0
-            total_count = int(result[2]) if result[2] else 0
-
-            logger.info("Spring 2025 acceptance rate: %s%% (%s/%s)", acceptance_rate, accepted_count, total_count)
-
-            return {
-                'question': 'What percent of entries for Spring 2025 are Acceptances?',
-                'answer': f"{acceptance_rate}%",
-                'accepted_count': accepted_count,
-                'total_count': total_count,
-                'query': 'SELECT COUNT(CASE WHEN status = %s THEN 1 END) * 100.0 / COUNT(*) FROM applicants WHERE term = %s LIMIT 1',
-                'explanation': f'Acceptance rate calculated from {total_count} Spring 2025 applications with {accepted_count} acceptances',
-                'methodology': 'Conditional aggregation using CASE WHEN for percentage calculation with LIMIT protection'
-            }
-        else:
-            return {
-                'question': 'What percent of entries for Spring 2025 are Acceptances?',
-                'answer': '0%',
-                'query': 'SELECT COUNT(CASE WHEN status = %s THEN 1 END) * 100.0 / COUNT(*) FROM applicants WHERE term = %s LIMIT 1',
-                'explanation': 'No Spring 2025 records found for analysis'
-            }
+        return _spring_2025_acceptance_rate_result(*(result or (None, None, None)))
     except Exception as exc:
         logger.error("Error in Spring 2025 acceptance rate query: %s", exc)
         return {'error': f"Acceptance rate calculation failed: {str(exc)}"}
 
 
+def _accepted_spring_2025_gpa_result(avg_gpa: Any) -> Dict[str, Any]:
+    """Format the Query 6 result from the raw average GPA."""
+    question = 'What is the average GPA of applicants who applied for Spring 2025 who are Acceptances?'
+    query = ('SELECT AVG(gpa) FROM applicants WHERE term = %s AND status = %s '
+             'AND gpa IS NOT NULL')
+
+    if avg_gpa is None:
+        return {
+            'question': question,
+            'answer': 0,
+            'query': query,
+            'explanation': 'No accepted Spring 2025 applicants with GPA data found'
+        }
+
+    avg_gpa = float(avg_gpa)
+
+    logger.info("Accepted Spring 2025 GPA: %s", avg_gpa)
+
+    return {
+        'question': question,
+        'answer': avg_gpa,
+        'query': query,
+        'explanation': 'Calculates mean GPA for successful Spring 2025 applicants only',
+        'methodology': 'Double-filtered AVG aggregation with term and status constraints'
+    }
+
+
 def get_accepted_spring_2025_gpa() -> Dict[str, Any]:
     """
     Query 6: Successful Applicant Academic Profile.
@@ -408,60 +658,30 @@ def get_accepted_spring_2025_gpa() -> Dict[str, Any]:
         Dict[str, Any]: Average GPA of accepted Spring 2025 applicants
     """
     try:
-        # Validate inputs
-        term = "Spring 2025"
-        status = "Accepted"
-
-        if not InputValidator.validate_term(term):
-            return {'error': 'Invalid term format'}
-        if not InputValidator.validate_status(status):
-            return {'error': 'Invalid status value'}
-
-        # Build secure query
-        query = sql.SQL("""
-            SELECT AVG({gpa}) as avg_gpa
-            FROM {table}
-            WHERE {term_field} = {term}
-                AND {status_field} = {status}
-                AND {gpa} IS NOT NULL
-            LIMIT 1
-        """).format(
-            gpa=sql.Identifier('gpa'),
-            table=sql.Identifier('applicants'),
-            term_field=sql.Identifier('term'),
-            status_field=sql.Identifier('status'),
-            term=sql.Literal(term),
-            status=sql.Literal(status)
+        # Execute precompiled query
+        result = run_one(
+            _Q_ACCEPTED_SPRING_2025_GPA, {'term': SPRING_2025, 'status': ACCEPTED}
         )
 
-        # Execute query
-        executor = SecureQueryExecutor()
-        result = executor.execute_single_result_query(query)
-
-        if result and result[0] is not None:
-            avg_gpa = round(float(result[0]), 3)
-
-            logger.info("Accepted Spring 2025 GPA: %s", avg_gpa)
-
-            return {
-                'question': 'What is the average GPA of applicants who applied for Spring 2025 who are Acceptances?',
-                'answer': avg_gpa,
-                'query': 'SELECT AVG(gpa) FROM applicants WHERE term = %s AND status = %s AND gpa IS NOT NULL LIMIT 1',
-                'explanation': 'Calculates mean GPA for successful Spring 2025 applicants only',
-                'methodology': 'Double-filtered AVG aggregation with term and status constraints plus LIMIT protection'
-            }
-        else:
-            return {
-                'question': 'What is the average GPA of applicants who applied for Spring 2025 who are Acceptances?',
-                'answer': 0,
-                'query': 'SELECT AVG(gpa) FROM applicants WHERE term = %s AND status = %s AND gpa IS NOT NULL LIMIT 1',
-                'explanation': 'No accepted Spring 2025 applicants with GPA data found'
-            }
+        return _accepted_spring_2025_gpa_result(result[0] if result else None)
     except Exception as exc:
         logger.error("Error in accepted Spring 2025 GPA query: %s", exc)
         return {'error': f"Accepted GPA calculation failed: {str(exc)}"}
 
 
+def _jhu_cs_masters_result(count: int) -> Dict[str, Any]:
+    """Format the Query 7 result for a JHU CS masters application count."""
+    logger.info("JHU CS masters count: %s", count)
+
+    return {
+        'question': 'How many entries are from applicants who applied to JHU for a masters degree in Computer Science?',
+        'answer': count,
+        'query': 'SELECT COUNT(*) FROM applicants WHERE program ILIKE %s AND program ILIKE %s AND (degree = %s OR degree = %s)',
+        'explanation': 'Count of Johns Hopkins University Computer Science masters applications',
+        'methodology': 'Secure pattern matching with input sanitization'
+    }
+
+
 def get_jhu_cs_masters_count() -> Dict[str, Any]:
     """
     Query 7: Johns Hopkins Computer Science Masters Applications.
@@ -473,71 +693,114 @@ def get_jhu_cs_masters_count() -> Dict[str, Any]:
         Dict[str, Any]: Count of JHU CS masters applications
     """
     try:
-        # Sanitize input patterns
-        university_pattern = "%Johns Hopkins University%"
-        program_pattern = "%Computer Science%"
-
-        # Build secure query
-        query = sql.SQL("""
-            SELECT COUNT(*) as count
-            FROM {table}
-            WHERE {program_field} LIKE {university_pattern}
-                AND {program_field} LIKE {program_pattern}
-                AND ({degree_field} = {ms1} OR {degree_field} = {ms2})
-            LIMIT 1000
-        """).format(
-            table=sql.Identifier('applicants'),
-            program_field=sql.Identifier('program'),
-            degree_field=sql.Identifier('degree'),
-            university_pattern=sql.Literal(university_pattern),
-            program_pattern=sql.Literal(program_pattern),
-            ms1=sql.Literal('MS'),
-            ms2=sql.Literal('Master')
-        )
-
-        # Execute query
-        executor = SecureQueryExecutor()
-        result = executor.execute_single_result_query(query)
-
-        count = result[0] if result else 0
-        logger.info("JHU CS masters count: %s", count)
-
-        return {
-            'question': 'How many entries are from applicants who applied to JHU for a masters degree in Computer Science?',
-            'answer': count,
-            'query': 'SELECT COUNT(*) FROM applicants WHERE program LIKE %s AND program LIKE %s AND (degree = %s OR degree = %s) LIMIT 1000',
-            'explanation': 'Count of Johns Hopkins University Computer Science masters applications',
-            'methodology': 'Secure pattern matching with input sanitization and LIMIT protection'
-        }
+        # Execute precompiled query
+        result = run_one(_Q_JHU_CS_MASTERS_COUNT, {
+            'university_pattern': JHU_PATTERN,
+            'program_pattern': CS_PATTERN,
+            'ms1': MASTERS_DEGREES[0],
+            'ms2': MASTERS_DEGREES[1]
+        })
+
+        return _jhu_cs_masters_result(result[0] if result else 0)
     except Exception as exc:
         logger.error("Error in JHU CS masters count query: %s", exc)
         return {'error': f"JHU count calculation failed: {str(exc)}"}
 
 
+def get_applicants_json(limit: int = 100) -> str:
+    """
+    Return applicant rows as a JSON array encoded by PostgreSQL.
+
+    Serializing in the database avoids building a Python dict per row and
+    re-encoding it; the result can be sent to the client as-is.
+
+    Args:
+        limit: Maximum number of rows, capped at MAX_APPLICANTS_JSON_LIMIT;
+            a whole number, or a string of one such as a query parameter
+
+    Returns:
+        str: JSON array of applicant objects ordered by p_id
+
+    Raises:
+        ValueError: If limit is not a whole number in the allowed range
+    """
+    # Parse strictly: "2.9", "nan" and "inf" are rejected rather than truncated
+    if isinstance(limit, int) and not isinstance(limit, bool):
+        row_limit = limit
+    elif isinstance(limit, float) and limit.is_integer():
+        row_limit = int(limit)
+    else:
+        try:
+            row_limit = int(str(limit), 10)
+        except ValueError:
+            raise ValueError(f"limit must be a whole number, got {limit!r}") from None
+
+    if not 1 <= row_limit <= MAX_APPLICANTS_JSON_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_APPLICANTS_JSON_LIMIT}")
+
+    result = run_one(_Q_APPLICANTS_JSON, {'limit': row_limit})
+    return result[0] if result else '[]'
+
+
+def iter_applicants_csv() -> Iterator[str]:
+    """
+    Yield every applicant row as CSV text, suitable for a streamed response.
+
+    Rows are read in FETCH_BATCH_SIZE batches from a server-side cursor and
+    each batch is written out as one chunk, so memory use stays bounded
+    however large the table is.
+
+    Yields:
+        str: The CSV header, then one chunk of rows per fetched batch
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+
+    exported = 0
+    try:
+        for rows in stream_query(_Q_APPLICANTS_EXPORT, name='applicants_export'):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            exported += len(rows)
+            yield buffer.getvalue()
+    except Exception:
+        # The response has already started, so this is the only record of the
+        # failure; re-raise so the download is cut short rather than looking complete
+        logger.exception("Applicants CSV export failed after %s rows", exported)
+        raise
+
+
 def get_all_analysis_results() -> Dict[str, Any]:
     """
     Compile all analysis results with comprehensive error handling.
 
+    All seven analyses are computed by a single fused query; the row is then
+    split into the same per-query results the individual functions return.
+
     Returns:
         Dict[str, Any]: Complete analysis results or error information
     """
     try:
-        query_1 = get_spring_2025_entries()
-        query_2 = get_international_percentage()
-        query_3 = get_average_scores()
-        query_4 = get_american_spring_2025_gpa()
-        query_5 = get_spring_2025_acceptance_rate()
-        query_6 = get_accepted_spring_2025_gpa()
-        query_7 = get_jhu_cs_masters_count()
+        (spring25_count, intl_pct, intl_count, nat_total,
+         avg_gpa, avg_gre, avg_gre_v, avg_gre_aw, amer_spring_gpa,
+         accept_pct, accept_count, accepted_spring_gpa,
+         jhu_count) = run_one(
+             _Q_FUSED_ANALYSIS, _FUSED_ANALYSIS_PARAMS
+         )
+
+        query_1 = _spring_2025_entries_result(spring25_count)
+        query_2 = _international_percentage_result(intl_pct, intl_count, nat_total)
+        query_3 = _average_scores_result(avg_gpa, avg_gre, avg_gre_v, avg_gre_aw)
+        query_4 = _american_spring_2025_gpa_result(amer_spring_gpa)
+        query_5 = _spring_2025_acceptance_rate_result(accept_pct, accept_count, spring25_count)
+        query_6 = _accepted_spring_2025_gpa_result(accepted_spring_gpa)
+        query_7 = _jhu_cs_masters_result(jhu_count)
 
         return {
-            'spring_2025_count': query_1.get('answer', 0),
-            'international_percentage': query_2.get('answer', 0),
-            'average_scores': query_3.get('answer', {}),
-            'american_spring_2025_gpa': query_4.get('answer', 0),
-            'spring_2025_acceptance_rate': query_5.get('answer', 0),
-            'accepted_spring_2025_gpa': query_6.get('answer', 0),
-            'jhu_cs_masters_count': query_7.get('answer', 0),
             'detailed_results': {
                 'spring_2025_entries': query_1,
                 'international_percentage': query_2,
@@ -5,39 +5,156 @@ Flask routes for the Graduate School Data Analysis application.
 Author: Abdullateef Mumin
 """
 
+import hmac
+import json
 import logging
-from flask import render_template, jsonify
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from flask import Response, render_template, jsonify, request
+from sqlalchemy import text
 from app import app, db
-from query_data import get_all_analysis_results
+import models
+from query_data import get_all_analysis_results, get_applicants_json, iter_applicants_csv
 
 logger = logging.getLogger(__name__)
 
-# Initialize database tables and load sample data
-with app.app_context():
-    try:
-        db.create_all()
-        logger.info("Database tables created successfully")
-
-        # Load sample data if database has insufficient records
-        from models import Applicant
-        current_count = Applicant.query.count()
-        if current_count < 10000:
-            logger.info("Loading 10,000 sample records...")
-            from load_data import load_sample_data
-            load_sample_data()
-            logger.info("Sample data loaded successfully")
-        else:
-            logger.info("Database already contains %s records", current_count)
+# Seconds a computed set of analysis results is served before being refreshed
+RESULTS_CACHE_TTL = 60
 
-    except Exception as exc:
-        logger.error("Error initializing database: %s", exc)
+# Single cached entry: (data version, expiry time, results, encoded JSON)
+_results_cache: Optional[Tuple[int, float, Dict[str, Any], bytes]] = None
+_results_cache_lock = threading.Lock()
+_results_cache_stats = {'hits': 0, 'misses': 0}
+
+# Arbitrary application-wide key for the database initialization advisory lock
+INIT_LOCK_KEY = 42
+
+
+def init_database() -> None:
+    """
+    Create or migrate the database tables and load sample data if the table is sparse.
+
+    A PostgreSQL advisory lock makes this safe to call from several worker
+    processes at once: the first caller does the work and the others skip it.
+    """
+    with db.engine.connect() as conn:
+        if not conn.execute(text("SELECT pg_try_advisory_lock(:key)"),
+                            {'key': INIT_LOCK_KEY}).scalar():
+            logger.info("Database initialization already running elsewhere, skipping")
+            return
+
+        try:
+            db.create_all()
+            models.migrate_schema()
+            logger.info("Database tables created successfully")
+
+            # Load sample data if database has insufficient records
+            current_count = models.Applicant.query.count()
+            if current_count < 10000:
+                logger.info("Loading 10,000 sample records...")
+                from load_data import load_sample_data  # pylint: disable=import-outside-toplevel
+                load_sample_data()
+                logger.info("Sample data loaded successfully")
+            else:
+                logger.info("Database already contains %s records", current_count)
+
+        except Exception as exc:
+            logger.error("Error initializing database: %s", exc)
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': INIT_LOCK_KEY})
+
+
+@app.cli.command('init-db')
+def init_db_command() -> None:
+    """Create the tables and load sample data (flask --app main init-db)."""
+    init_database()
+
+
+def _encode_json(results: Dict[str, Any]) -> bytes:
+    """Encode results the way jsonify does: sorted keys, compact separators."""
+    return json.dumps(results, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _get_cached_analysis() -> Tuple[Dict[str, Any], bytes]:
+    """
+    Return the analysis results and their JSON encoding, reusing a recent
+    computation if possible.
+
+    Results are cached for RESULTS_CACHE_TTL seconds and are recomputed
+    early if new data has been loaded since. The JSON is encoded once per
+    computation, so API cache hits skip serialization entirely. Error
+    results are not cached.
+
+    Returns:
+        Tuple[Dict[str, Any], bytes]: Analysis results and their JSON encoding
+    """
+    global _results_cache  # pylint: disable=global-statement
+    version = models.DATA_VERSION
+
+    with _results_cache_lock:
+        entry = _results_cache
+        if entry is not None and entry[0] == version and entry[1] > time.monotonic():
+            _results_cache_stats['hits'] += 1
+            return entry[2], entry[3]
+        _results_cache_stats['misses'] += 1
+
+    logger.info("Analysis results cache miss (hits=%s, misses=%s)",
+                _results_cache_stats['hits'], _results_cache_stats['misses'])
+    results = get_all_analysis_results()
+    payload = _encode_json(results)
+
+    if 'error' not in results:
+        with _results_cache_lock:
+            _results_cache = (version, time.monotonic() + RESULTS_CACHE_TTL, results, payload)
+
+    return results, payload
+
+
+def get_cached_analysis_results() -> Dict[str, Any]:
+    """
+    Return the analysis results, reusing a recent computation if possible.
+
+    Returns:
+        Dict[str, Any]: Complete analysis results or error information
+    """
+    return _get_cached_analysis()[0]
+
+
+@app.route('/cache/flush', methods=['POST'])
+def flush_cache():
+    """
+    Discard cached analysis results and report cache statistics.
+
+    Requests must send the configured CACHE_FLUSH_TOKEN in the
+    X-Admin-Token header. The route is disabled when no token is
+    configured. The cache lives in each server process, so flushing
+    cannot be done from a separate CLI command.
+    """
+    global _results_cache  # pylint: disable=global-statement
+    expected = app.config.get('CACHE_FLUSH_TOKEN')
+    if not expected:
+        return jsonify({'error': 'Not found'}), 404
+
+    supplied = request.headers.get('X-Admin-Token', '')
+    if not hmac.compare_digest(supplied.encode('utf-8'), expected.encode('utf-8')):
+        logger.warning("Rejected cache flush with a missing or invalid token")
+        return jsonify({'error': 'Forbidden'}), 403
+
+    with _results_cache_lock:
+        _results_cache = None
+        stats = dict(_results_cache_stats)
+
+    logger.info("Analysis results cache flushed (hits=%s, misses=%s)",
+                stats['hits'], stats['misses'])
+    return jsonify({'status': 'flushed', **stats})
 
 
 @app.route('/')
 def index():
     """Main dashboard route."""
     try:
-        results = get_all_analysis_results()
+        results = get_cached_analysis_results()
         return render_template('index.html', results=results)
     except Exception as exc:
         logger.error("Dashboard error: %s", exc)
@@ -46,15 +163,35 @@ def index():
 
 @app.route('/api/results')
 def api_results():
-    """JSON API endpoint."""
+    """JSON API endpoint serving the pre-encoded cached results."""
     try:
-        results = get_all_analysis_results()
-        return jsonify(results)
+        _, payload = _get_cached_analysis()
+        return Response(payload, mimetype='application/json')
     except Exception as exc:
         logger.error("API error: %s", exc)
         return jsonify({'error': str(exc)}), 500
 
 
+@app.route('/api/applicants')
+def api_applicants():
+    """JSON API endpoint listing applicant records, encoded by PostgreSQL."""
+    try:
+        payload = get_applicants_json(request.args.get('limit', 100))
+        return Response(payload, mimetype='application/json')
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+    except Exception as exc:
+        logger.error("Applicants API error: %s", exc)
+        return jsonify({'error': str(exc)}), 500
+
+
+@app.route('/api/applicants.csv')
+def api_applicants_csv():
+    """CSV export of every applicant record, streamed from a server-side cursor."""
+    return Response(iter_applicants_csv(), mimetype='text/csv',
+                    headers={'Content-Disposition': 'attachment; filename=applicants.csv'})
+
+
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
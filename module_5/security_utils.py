@@ -8,309 +8,406 @@ sql module and comprehensive input validation functions.
 Author: Abdullateef Mumin
 """
 
-import re
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from psycopg2 import sql
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-class QueryBuilder:
-    """Secure SQL query builder using psycopg's sql composition."""
-
-    @staticmethod
-    def build_count_query(table: str, conditions: Dict[str, Any]) -> sql.Composed:
-        """
-        Build a secure COUNT query with conditions.
-
-        Args:
-            table: Table name to query
-            conditions: Dictionary of field:value conditions
-
-        Returns:
-            sql.Composed: Secure SQL query object
-        """
-        query = sql.SQL("SELECT COUNT(*) FROM {table}").format(
-            table=sql.Identifier(table)
+# Characters stripped by sanitize_string, and the table deleting them
+_DANGEROUS_CHARS = '<>"\';\\'
+_STRIP_TABLE = str.maketrans('', '', _DANGEROUS_CHARS)
+
+# Table escaping LIKE metacharacters and deleting dangerous characters in one pass
+_LIKE_TABLE = str.maketrans({
+    '\\': '\\\\',
+    '%': '\\%',
+    '_': '\\_',
+    **dict.fromkeys('<>"\';'),
+})
+
+# Seasons accepted by validate_term
+_VALID_SEASONS = frozenset(('Spring', 'Fall', 'Summer', 'Winter'))
+
+# Accepted admission statuses and nationality classifications
+_VALID_STATUSES = frozenset({'Accepted', 'Rejected', 'Waitlisted', 'Pending'})
+_VALID_NATIONALITIES = frozenset({'American', 'International', 'Other'})
+
+# SQL fragments shared by the query templates
+_SELECT_COUNT = sql.SQL("SELECT COUNT(*) FROM {table}")
+_SELECT_FIELDS = sql.SQL("SELECT {fields} FROM {table}")
+_AVG_FIELD = sql.SQL("AVG({field}) as avg_{field}")
+_AND = sql.SQL(" AND ")
+_COMMA = sql.SQL(", ")
+_EQ = sql.SQL("{field} = {value}")
+_LIKE = sql.SQL("{field} LIKE {pattern}")
+_IS_NOT_NULL = sql.SQL("{field} IS NOT NULL")
+_WHERE = sql.SQL("{query} WHERE {conditions}")
+_PERCENTAGE = sql.SQL("""
+    SELECT
+        COUNT(CASE WHEN {field} = {value} THEN 1 END) * 100.0 / COUNT(*) as percentage,
+        COUNT(CASE WHEN {field} = {value} THEN 1 END) as match_count,
+        COUNT(*) as total_count
+    FROM {table}
+    WHERE {field} IS NOT NULL
+""")
+
+
+@lru_cache(maxsize=128)
+def _ident(name: str) -> sql.Identifier:
+    """Return a shared sql.Identifier for a table or column name."""
+    return sql.Identifier(name)
+
+
+def _present(conditions: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the conditions whose value is not None, in their original order."""
+    return {field: value for field, value in (conditions or {}).items() if value is not None}
+
+
+def _condition_params(conditions: Dict[str, Any]) -> Dict[str, Any]:
+    """Map present conditions to the parameter names used by the templates."""
+    return {f"cond_{field}": value for field, value in conditions.items()}
+
+
+def _equals_clauses(cond_fields: Tuple[str, ...]) -> List[sql.Composed]:
+    """Build "field = %(cond_field)s" clauses for the given fields."""
+    return [
+        _EQ.format(
+            field=_ident(field),
+            value=sql.Placeholder(f"cond_{field}")
         )
+        for field in cond_fields
+    ]
 
-        if conditions:
-            where_clauses = []
-            for field, value in conditions.items():
-                if value is not None:
-                    where_clauses.append(
-                        sql.SQL("{field} = {value}").format(
-                            field=sql.Identifier(field),
-                            value=sql.Literal(value)
-                        )
-                    )
-
-            if where_clauses:
-                query = sql.SQL("{query} WHERE {conditions} LIMIT 1").format(
-                    query=query,
-                    conditions=sql.SQL(" AND ").join(where_clauses)
-                )
-
-        return query
-
-    @staticmethod
-    def build_average_query(table: str, fields: List[str],
-                          conditions: Dict[str, Any]) -> sql.Composed:
-        """
-        Build a secure AVG query for multiple fields.
-
-        Args:
-            table: Table name to query
-            fields: List of field names to average
-            conditions: Dictionary of field:value conditions
-
-        Returns:
-            sql.Composed: Secure SQL query object
-        """
-        avg_fields = []
-        for field in fields:
-            avg_fields.append(
-                sql.SQL("AVG({field}) as avg_{field}").format(
-                    field=sql.Identifier(field)
-                )
-            )
 
-        query = sql.SQL("SELECT {fields} FROM {table}").format(
-            fields=sql.SQL(", ").join(avg_fields),
-            table=sql.Identifier(table)
-        )
+@lru_cache(maxsize=256)
+def _count_template(table: str, cond_fields: Tuple[str, ...]) -> sql.Composed:
+    """Compose the COUNT query for a table and set of condition fields."""
+    query = _SELECT_COUNT.format(
+        table=_ident(table)
+    )
 
-        # Add WHERE conditions
-        if conditions:
-            where_clauses = []
-            for field, value in conditions.items():
-                if value is not None:
-                    where_clauses.append(
-                        sql.SQL("{field} = {value}").format(
-                            field=sql.Identifier(field),
-                            value=sql.Literal(value)
-                        )
-                    )
-
-            # Add NOT NULL conditions for averaged fields
-            for field in fields:
-                where_clauses.append(
-                    sql.SQL("{field} IS NOT NULL").format(
-                        field=sql.Identifier(field)
-                    )
-                )
-
-            if where_clauses:
-                query = sql.SQL("{query} WHERE {conditions} LIMIT 10000").format(
-                    query=query,
-                    conditions=sql.SQL(" AND ").join(where_clauses)
-                )
-
-        return query
-
-    @staticmethod
-    def build_percentage_query(table: str, condition_field: str,
-                             condition_value: str) -> sql.Composed:
-        """
-        Build a secure percentage calculation query.
-
-        Args:
-            table: Table name to query
-            condition_field: Field to check for condition
-            condition_value: Value to match for percentage calculation
-
-        Returns:
-            sql.Composed: Secure SQL query object
-        """
-        query = sql.SQL("""
-            SELECT
-                COUNT(CASE WHEN {field} = {value} THEN 1 END) * 100.0 / COUNT(*) as percentage,
-                COUNT(CASE WHEN {field} = {value} THEN 1 END) as match_count,
-                COUNT(*) as total_count
-            FROM {table}
-            WHERE {field} IS NOT NULL
-            LIMIT 1
-        """).format(
-            field=sql.Identifier(condition_field),
-            value=sql.Literal(condition_value),
-            table=sql.Identifier(table)
+    if cond_fields:
+        query = _WHERE.format(
+            query=query,
+            conditions=_AND.join(_equals_clauses(cond_fields))
         )
 
-        return query
+    return query
 
-    @staticmethod
-    def build_like_query(table: str, field: str, pattern: str,
-                        additional_conditions: Dict[str, Any]) -> sql.Composed:
-        """
-        Build a secure LIKE query with pattern matching.
 
-        Args:
-            table: Table name to query
-            field: Field to search with LIKE
-            pattern: Pattern to match (will be sanitized)
-            additional_conditions: Additional WHERE conditions
+@lru_cache(maxsize=256)
+def _average_template(table: str, fields: Tuple[str, ...], cond_fields: Tuple[str, ...],
+                      filtered: bool) -> sql.Composed:
+    """Compose the AVG query for a table, averaged fields and condition fields."""
+    avg_fields = [_AVG_FIELD.format(field=_ident(field)) for field in fields]
 
-        Returns:
-            sql.Composed: Secure SQL query object
-        """
-        # Sanitize pattern to prevent injection
-        sanitized_pattern = InputValidator.sanitize_like_pattern(pattern)
+    query = _SELECT_FIELDS.format(
+        fields=_COMMA.join(avg_fields),
+        table=_ident(table)
+    )
 
-        query = sql.SQL("SELECT COUNT(*) FROM {table}").format(
-            table=sql.Identifier(table)
-        )
+    # Add WHERE conditions
+    if filtered:
+        where_clauses = _equals_clauses(cond_fields)
+
+        # Add NOT NULL conditions for averaged fields
+        where_clauses.extend(_IS_NOT_NULL.format(field=_ident(field)) for field in fields)
 
-        where_clauses = [
-            sql.SQL("{field} LIKE {pattern}").format(
-                field=sql.Identifier(field),
-                pattern=sql.Literal(sanitized_pattern)
+        if where_clauses:
+            query = _WHERE.format(
+                query=query,
+                conditions=_AND.join(where_clauses)
             )
-        ]
-
-        # Add additional conditions
-        for cond_field, value in additional_conditions.items():
-            if value is not None:
-                where_clauses.append(
-                    sql.SQL("{field} = {value}").format(
-                        field=sql.Identifier(cond_field),
-                        value=sql.Literal(value)
-                    )
-                )
-
-        query = sql.SQL("{query} WHERE {conditions} LIMIT 1000").format(
-            query=query,
-            conditions=sql.SQL(" AND ").join(where_clauses)
+
+    return query
+
+
+@lru_cache(maxsize=256)
+def _percentage_template(table: str, condition_field: str) -> sql.Composed:
+    """Compose the percentage query for a table and condition field."""
+    return _PERCENTAGE.format(
+        field=_ident(condition_field),
+        value=sql.Placeholder('value'),
+        table=_ident(table)
+    )
+
+
+@lru_cache(maxsize=256)
+def _like_template(table: str, field: str, cond_fields: Tuple[str, ...]) -> sql.Composed:
+    """Compose the LIKE query for a table, matched field and condition fields."""
+    query = _SELECT_COUNT.format(
+        table=_ident(table)
+    )
+
+    where_clauses = [
+        _LIKE.format(
+            field=_ident(field),
+            pattern=sql.Placeholder('pattern')
         )
+    ]
 
-        return query
+    # Add additional conditions
+    where_clauses.extend(_equals_clauses(cond_fields))
 
+    return _WHERE.format(
+        query=query,
+        conditions=_AND.join(where_clauses)
+    )
 
-class InputValidator:
-    """Input validation and sanitization utilities."""
-
-    @staticmethod
-    def sanitize_string(input_str: str, max_length: int = 255) -> str:
-        """
-        Sanitize string input to prevent injection attacks.
-
-        Args:
-            input_str: Input string to sanitize
-            max_length: Maximum allowed length
-
-        Returns:
-            str: Sanitized string
-        """
-        if not isinstance(input_str, str):
-            return ""
-
-        # Remove potentially dangerous characters
-        sanitized = re.sub(r'[<>"\';\\]', '', input_str)
-
-        # Limit length
-        sanitized = sanitized[:max_length]
-
-        # Strip whitespace
-        return sanitized.strip()
-
-    @staticmethod
-    def sanitize_like_pattern(pattern: str) -> str:
-        """
-        Sanitize LIKE pattern to prevent SQL injection.
-
-        Args:
-            pattern: LIKE pattern to sanitize
-
-        Returns:
-            str: Sanitized pattern
-        """
-        if not isinstance(pattern, str):
-            return "%"
-
-        # Escape special LIKE characters
-        pattern = pattern.replace('\\', '\\\\')
-        pattern = pattern.replace('%', '\\%')
-        pattern = pattern.replace('_', '\\_')
-
-        # Remove dangerous characters
-        pattern = re.sub(r'[<>"\';]', '', pattern)
-
-        # Wrap with wildcards
-        return f"%{pattern}%"
-
-    @staticmethod
-    def validate_numeric(value: Any, min_val: float = None,
-                        max_val: float = None) -> Optional[float]:
-        """
-        Validate and convert numeric input.
-
-        Args:
-            value: Value to validate
-            min_val: Minimum allowed value
-            max_val: Maximum allowed value
-
-        Returns:
-            Optional[float]: Validated numeric value or None if invalid
-        """
-        try:
-            num_val = float(value)
 
-            if min_val is not None and num_val < min_val:
-                return None
-            if max_val is not None and num_val > max_val:
-                return None
+def sanitize_string(input_str: str, max_length: int = 255) -> str:
+    """
+    Sanitize string input to prevent injection attacks.
+
+    Args:
+        input_str: Input string to sanitize
+        max_length: Maximum allowed length
+
+    Returns:
+        str: Sanitized string
+    """
+    if not isinstance(input_str, str):
+        return ""
+
+    # Clean input (the common case) needs no translation pass
+    if not any(char in input_str for char in _DANGEROUS_CHARS):
+        return input_str[:max_length].strip()
+
+    # Remove potentially dangerous characters, limit length, strip whitespace
+    return input_str.translate(_STRIP_TABLE)[:max_length].strip()
+
 
-            return num_val
+def sanitize_like_pattern(pattern: str) -> str:
+    """
+    Sanitize LIKE pattern to prevent SQL injection.
+
+    Args:
+        pattern: LIKE pattern to sanitize
+
+    Returns:
+        str: Sanitized pattern
+    """
+    if not isinstance(pattern, str):
+        return "%"
+
+    # Escape special LIKE characters and remove dangerous characters
+    pattern = pattern.translate(_LIKE_TABLE)
+
+    # Wrap with wildcards
+    return f"%{pattern}%"
+
+
+def validate_numeric(value: Any, min_val: float = None,
+                     max_val: float = None) -> Optional[float]:
+    """
+    Validate and convert numeric input.
+
+    Args:
+        value: Value to validate
+        min_val: Minimum allowed value
+        max_val: Maximum allowed value
+
+    Returns:
+        Optional[float]: Validated numeric value or None if invalid
+    """
+    # Values from the database are usually numbers already
+    if isinstance(value, float):
+        num_val = value
+    elif isinstance(value, int):
+        num_val = float(value)
+    else:
+        try:
+            num_val = float(value)
         except (ValueError, TypeError):
             return None
 
-    @staticmethod
-    def validate_term(term: str) -> bool:
-        """
-        Validate academic term format.
+    if min_val is not None and num_val < min_val:
+        return None
+    if max_val is not None and num_val > max_val:
+        return None
+
+    return num_val
+
+
+def validate_term(term: str) -> bool:
+    """
+    Validate academic term format.
+
+    Args:
+        term: Academic term to validate
+
+    Returns:
+        bool: True if valid term format
+    """
+    if not isinstance(term, str):
+        return False
+
+    # Valid term patterns: "Spring 2025", "Fall 2024", etc. Like the anchored
+    # regex this replaced, a single trailing newline is allowed.
+    if term.endswith('\n'):
+        term = term[:-1]
+    parts = term.split()
+    return (len(parts) == 2 and parts[0] in _VALID_SEASONS
+            and len(parts[1]) == 4 and parts[1].isdecimal()
+            and term == term.strip())
 
-        Args:
-            term: Academic term to validate
 
-        Returns:
-            bool: True if valid term format
-        """
-        if not isinstance(term, str):
-            return False
+def validate_status(status: str) -> bool:
+    """
+    Validate admission status value.
 
-        # Valid term patterns: "Spring 2025", "Fall 2024", etc.
-        pattern = r'^(Spring|Fall|Summer|Winter)\s+\d{4}$'
-        return bool(re.match(pattern, term))
+    Args:
+        status: Status to validate
 
-    @staticmethod
-    def validate_status(status: str) -> bool:
-        """
-        Validate admission status value.
+    Returns:
+        bool: True if valid status
+    """
+    return status in _VALID_STATUSES
 
-        Args:
-            status: Status to validate
 
-        Returns:
-            bool: True if valid status
-        """
-        valid_statuses = {'Accepted', 'Rejected', 'Waitlisted', 'Pending'}
-        return status in valid_statuses
+def validate_nationality(nationality: str) -> bool:
+    """
+    Validate nationality classification.
+
+    Args:
+        nationality: Nationality to validate
 
-    @staticmethod
-    def validate_nationality(nationality: str) -> bool:
-        """
-        Validate nationality classification.
+    Returns:
+        bool: True if valid nationality
+    """
+    return nationality in _VALID_NATIONALITIES
+
+
+def build_count_query(table: str,
+                      conditions: Dict[str, Any]) -> Tuple[sql.Composed, Dict[str, Any]]:
+    """
+    Build a secure COUNT query with conditions.
+
+    Args:
+        table: Table name to query
+        conditions: Dictionary of field:value conditions
 
-        Args:
-            nationality: Nationality to validate
+    Returns:
+        Tuple[sql.Composed, Dict[str, Any]]: Secure SQL query and its parameters.
+        This used to return a bare sql.Composed with values inlined and
+        LIMIT 1 on filtered counts; unpack the tuple for cursor.execute().
+    """
+    # Unfiltered counts skip condition filtering entirely
+    if not conditions:
+        return _count_template(table, ()), {}
+
+    present = _present(conditions)
+    return _count_template(table, tuple(present)), _condition_params(present)
+
+
+def build_average_query(table: str, fields: List[str],
+                        conditions: Dict[str, Any]) -> Tuple[sql.Composed, Dict[str, Any]]:
+    """
+    Build a secure AVG query for multiple fields.
+
+    Args:
+        table: Table name to query
+        fields: List of field names to average
+        conditions: Dictionary of field:value conditions
+
+    Returns:
+        Tuple[sql.Composed, Dict[str, Any]]: Secure SQL query and its parameters.
+        This used to return a bare sql.Composed with values inlined and
+        LIMIT 10000 when filtered; unpack the tuple for cursor.execute().
+    """
+    if not conditions:
+        return _average_template(table, tuple(fields), (), False), {}
+
+    present = _present(conditions)
+    template = _average_template(table, tuple(fields), tuple(present), True)
+    return template, _condition_params(present)
+
+
+def build_percentage_query(table: str, condition_field: str,
+                           condition_value: str) -> Tuple[sql.Composed, Dict[str, Any]]:
+    """
+    Build a secure percentage calculation query.
+
+    Args:
+        table: Table name to query
+        condition_field: Field to check for condition
+        condition_value: Value to match for percentage calculation
+
+    Returns:
+        Tuple[sql.Composed, Dict[str, Any]]: Secure SQL query and its parameters.
+        This used to return a bare sql.Composed with the value inlined and
+        LIMIT 1; unpack the tuple for cursor.execute().
+    """
+    return _percentage_template(table, condition_field), {'value': condition_value}
+
+
+def build_like_query(table: str, field: str, pattern: str,
+                     additional_conditions: Dict[str, Any]) -> Tuple[sql.Composed, Dict[str, Any]]:
+    """
+    Build a secure LIKE query with pattern matching.
+
+    Args:
+        table: Table name to query
+        field: Field to search with LIKE
+        pattern: Pattern to match (will be sanitized)
+        additional_conditions: Additional WHERE conditions
+
+    Returns:
+        Tuple[sql.Composed, Dict[str, Any]]: Secure SQL query and its parameters.
+        This used to return a bare sql.Composed with the pattern inlined and
+        LIMIT 1000; unpack the tuple for cursor.execute().
+    """
+    # Sanitize pattern to prevent injection
+    like_pattern = sanitize_like_pattern(pattern)
+
+    if not additional_conditions:
+        return _like_template(table, field, ()), {'pattern': like_pattern}
+
+    present = _present(additional_conditions)
+    params = _condition_params(present)
+    params['pattern'] = like_pattern
+
+    return _like_template(table, field, tuple(present)), params
+
+
+class QueryBuilder:
+    """
+    Secure SQL query builder using psycopg's sql composition.
+
+    Each builder returns a query template and the parameters to execute it
+    with, e.g. cursor.execute(*build_count_query(...)). Values are bound as
+    placeholders, so templates depend only on the query's shape (table,
+    fields and condition names) and are cached by it.
+
+    The builders are module-level functions; this class keeps the original
+    QueryBuilder.build_* names, but note the return type changed: they used
+    to return one sql.Composed with values inlined (and a LIMIT on filtered
+    queries), and now return a (template, params) tuple with no LIMIT.
+    Existing callers must unpack the tuple and add any LIMIT themselves.
+    """
+
+    build_count_query = staticmethod(build_count_query)
+    build_average_query = staticmethod(build_average_query)
+    build_percentage_query = staticmethod(build_percentage_query)
+    build_like_query = staticmethod(build_like_query)
+
+
+class InputValidator:
+    """
+    Input validation and sanitization utilities.
+
+    The validators are module-level functions; this class keeps the original
+    InputValidator.* API working.
+    """
 
-        Returns:
-            bool: True if valid nationality
-        """
-        valid_nationalities = {'American', 'International', 'Other'}
-        return nationality in valid_nationalities
+    sanitize_string = staticmethod(sanitize_string)
+    sanitize_like_pattern = staticmethod(sanitize_like_pattern)
+    validate_numeric = staticmethod(validate_numeric)
+    validate_term = staticmethod(validate_term)
+    validate_status = staticmethod(validate_status)
+    validate_nationality = staticmethod(validate_nationality)
 
 
 def log_query_execution(query: sql.Composed, params: Dict[str, Any] = None) -> None:
@@ -321,6 +418,8 @@ def log_query_execution(query: sql.Composed, params: Dict[str, Any] = None) -> N
         query: SQL query being executed
         params: Query parameters
     """
-    logger.info("Executing secure SQL query: %s", query.as_string())
-    if params:
+    # Rendering the query walks the whole Composed tree, so only do it when logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Executing secure SQL query: %s", query.as_string())
+    if params and logger.isEnabledFor(logging.DEBUG):
         logger.debug("Query parameters: %s", params)
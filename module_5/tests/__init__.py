@@ -0,0 +1,5 @@
+"""
+Test package for the graduate school data analysis application.
+
+This package contains tests for the data loading and input validation modules.
+"""
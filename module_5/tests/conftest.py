@@ -0,0 +1,74 @@
+"""
+Shared fixtures for the graduate school data analysis tests.
+
+The loading tests truncate and reload the applicants table, so they run
+only against a scratch PostgreSQL database named by TEST_DATABASE_URL.
+The application reads DATABASE_URL when it is imported, so it is pointed
+at that database before any test imports it.
+"""
+
+import os
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+
+@pytest.fixture(scope="session")
+def load_data():
+    """The load_data module, with the applicants table created."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    
+    # pylint: disable=import-outside-toplevel
+    import load_data as module
+    from app import app, db
+    
+    with app.app_context():
+        db.create_all()
+    return module
+
+
+@pytest.fixture
+def copy_only(load_data, monkeypatch):  # pylint: disable=redefined-outer-name
+    """The load_data module with the batched INSERT fallback disabled."""
+    def fail(*args, **kwargs):
+        raise AssertionError("COPY was rejected and the INSERT fallback ran")
+    
+    monkeypatch.setattr(load_data, '_insert_rows_in_batches', fail)
+    return load_data
+
+
+@pytest.fixture
+def write_csv(tmp_path):
+    """Write applicant rows to a CSV file and return its path."""
+    def write(rows):
+        header = "p_id,program,date_added,status,term,us_or_international,gpa,gre,degree"
+        path = tmp_path / "applicants.csv"
+        path.write_text("\n".join([header, *rows]) + "\n", encoding='utf-8')
+        return str(path)
+    
+    return write
+
+
+@pytest.fixture(scope="session")
+def flask_app():
+    """
+    The Flask application, for tests that never reach the database.
+    
+    The app needs DATABASE_URL to import but connects lazily, so without a
+    test database it is given a placeholder URL that is never dialled.
+    """
+    os.environ.setdefault("DATABASE_URL", "postgresql+psycopg2://localhost/unused")
+    
+    # pylint: disable=import-outside-toplevel
+    from app import app
+    
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(flask_app):  # pylint: disable=redefined-outer-name
+    """A Flask test client for requests rejected before any query runs."""
+    return flask_app.test_client()
@@ -0,0 +1,60 @@
+"""
+Tests for bulk loading applicant data into PostgreSQL.
+
+These tests check that CSV data is loaded through COPY rather than the
+batched INSERT fallback, and that records without a usable p_id are kept.
+"""
+
+
+def _loaded_p_ids(module):
+    """Return the p_ids in the applicants table, in ascending order."""
+    applicant = module.Applicant
+    with module.app.app_context():
+        return module.db.session.scalars(
+            module.db.select(applicant.p_id).order_by(applicant.p_id)
+        ).all()
+
+
+class TestLoadData:
+    """Test cases for loading applicant data."""
+    
+    def test_copy_loads_csv_records(self, copy_only, write_csv):
+        """
+        Test CSV records are loaded by COPY without falling back to INSERT.
+        
+        The validators return p_id as a float, which must still reach the
+        INTEGER key column as a whole number.
+        """
+        path = write_csv([
+            "5,MIT - Computer Science,2025-01-15,Accepted,Spring 2025,American,3.9,165,MS",
+            "7,Johns Hopkins University - Computer Science,01/20/2025,Rejected,"
+            "Spring 2025,International,3.5,160,PhD",
+        ])
+        
+        data = copy_only.load_data_from_csv(path)
+        copy_only.insert_data_to_database(data)
+        
+        assert _loaded_p_ids(copy_only) == [5, 7]
+    
+    def test_records_without_p_id_are_assigned_one(self, copy_only, write_csv):
+        """
+        Test records with a missing or invalid p_id get keys from the sequence.
+        
+        The assigned keys must not collide with the explicitly loaded ones.
+        """
+        path = write_csv([
+            "5,MIT - Computer Science,2025-01-15,Accepted,Spring 2025,American,3.9,165,MS",
+            ",Yale University - Computer Science,2025-01-16,Pending,Spring 2025,Other,,,MS",
+            "abc,Princeton University - Computer Science,2025-01-17,Accepted,"
+            "Spring 2025,American,3.7,168,PhD",
+        ])
+        
+        data = copy_only.load_data_from_csv(path)
+        assert len(data) == 3
+        
+        copy_only.insert_data_to_database(data)
+        
+        p_ids = _loaded_p_ids(copy_only)
+        assert len(p_ids) == 3
+        assert p_ids[0] == 5
+        assert all(p_id > 5 for p_id in p_ids[1:])
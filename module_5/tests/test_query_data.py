@@ -0,0 +1,91 @@
+"""
+Tests for the streamed applicant CSV export.
+
+stream_query is replaced with canned batches, so these tests exercise the
+CSV chunking without a database.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import csv
+import io
+import logging
+import pytest
+
+
+@pytest.fixture
+def query_data(flask_app):  # pylint: disable=unused-argument
+    """The query_data module, imported once the app is configured."""
+    # pylint: disable=import-outside-toplevel
+    import query_data as module
+    return module
+
+
+@pytest.fixture
+def export(query_data, monkeypatch):
+    """Run iter_applicants_csv over the given batches and return its chunks."""
+    def run(batches):
+        monkeypatch.setattr(query_data, 'stream_query', lambda *args, **kwargs: iter(batches))
+        return list(query_data.iter_applicants_csv())
+    
+    return run
+
+
+def _row(p_id, columns):
+    """Return an applicant row with one value per export column."""
+    return tuple(f"{column}-{p_id}" if column != 'p_id' else p_id for column in columns)
+
+
+class TestIterApplicantsCsv:
+    """Test cases for iter_applicants_csv."""
+    
+    def test_empty_table_yields_only_header(self, query_data, export):
+        """
+        Test an empty table exports just the header, in EXPORT_COLUMNS order.
+        """
+        chunks = export([])
+        
+        assert chunks == [",".join(query_data.EXPORT_COLUMNS) + "\r\n"]
+    
+    def test_one_chunk_per_batch(self, query_data, export):
+        """
+        Test each fetched batch becomes exactly one chunk holding only its rows.
+        """
+        columns = query_data.EXPORT_COLUMNS
+        batches = [[_row(1, columns), _row(2, columns)], [_row(3, columns)]]
+        
+        chunks = export(batches)
+        
+        assert len(chunks) == 1 + len(batches)
+        for chunk, batch in zip(chunks[1:], batches):
+            assert [int(row[0]) for row in csv.reader(io.StringIO(chunk))] == [
+                row[0] for row in batch
+            ]
+    
+    def test_rows_follow_export_column_order(self, query_data, export):
+        """
+        Test the concatenated output parses back to the header and rows in order.
+        """
+        columns = query_data.EXPORT_COLUMNS
+        batches = [[_row(1, columns)], [_row(2, columns)]]
+        
+        reader = csv.DictReader(io.StringIO("".join(export(batches))))
+        
+        assert tuple(reader.fieldnames) == tuple(columns)
+        assert [row['status'] for row in reader] == ['status-1', 'status-2']
+    
+    def test_failure_is_logged_and_raised(self, query_data, monkeypatch, caplog):
+        """
+        Test a failing stream is logged as a failed CSV export and re-raised.
+        """
+        def failing_stream(*args, **kwargs):
+            yield [_row(1, query_data.EXPORT_COLUMNS)]
+            raise RuntimeError("connection lost")
+        
+        monkeypatch.setattr(query_data, 'stream_query', failing_stream)
+        
+        with caplog.at_level(logging.ERROR, logger=query_data.logger.name):
+            with pytest.raises(RuntimeError):
+                list(query_data.iter_applicants_csv())
+        
+        assert "Applicants CSV export failed after 1 rows" in caplog.text
@@ -0,0 +1,29 @@
+"""
+Tests for request validation in the Flask routes.
+"""
+
+import pytest
+
+
+class TestApplicantsApi:
+    """Test cases for the /api/applicants limit parameter."""
+    
+    @pytest.mark.parametrize("limit", ["0", "-5", "1001"])
+    def test_out_of_range_limit_is_rejected(self, client, limit):
+        """
+        Test limits outside 1..MAX_APPLICANTS_JSON_LIMIT return 400.
+        """
+        response = client.get(f"/api/applicants?limit={limit}")
+        
+        assert response.status_code == 400
+        assert response.get_json() == {'error': 'limit must be between 1 and 1000'}
+    
+    @pytest.mark.parametrize("limit", ["nan", "inf", "2.9", "ten", ""])
+    def test_non_integral_limit_is_rejected(self, client, limit):
+        """
+        Test limits that are not whole numbers return 400 rather than being truncated.
+        """
+        response = client.get(f"/api/applicants?limit={limit}")
+        
+        assert response.status_code == 400
+        assert response.get_json() == {'error': f"limit must be a whole number, got {limit!r}"}
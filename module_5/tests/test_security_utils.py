@@ -0,0 +1,149 @@
+"""
+Tests for the input validation utilities.
+"""
+
+import re
+import pytest
+
+security_utils = pytest.importorskip("security_utils")
+
+# The regular expression validate_term originally used
+TERM_RE = re.compile(r'^(Spring|Fall|Summer|Winter)\s+\d{4}$')
+
+
+class TestValidateTerm:
+    """Test cases for validate_term."""
+    
+    @pytest.mark.parametrize("term", [
+        "Spring 2025", "Fall  2024", "Winter\t2023", "Summer\n2022",
+        "Spring 2025\n", "Spring 2025\n\n", " Spring 2025", "Spring 2025 ",
+        "Spring 2025 \n", "spring 2025", "Spring 20255", "Spring 202a",
+        "Spring2025", "Autumn 2025", "Spring 2025 extra", "",
+    ])
+    def test_validate_term_matches_original_regex(self, term):
+        """
+        Test validate_term accepts exactly the terms the original regex did.
+        
+        This includes a single trailing newline, which the regex's $ allowed.
+        """
+        assert security_utils.validate_term(term) == bool(TERM_RE.match(term))
+    
+    def test_validate_term_allows_single_trailing_newline(self):
+        """
+        Test a single trailing newline is accepted and a second is not.
+        """
+        assert security_utils.validate_term("Fall 2024\n")
+        assert not security_utils.validate_term("Fall 2024\n\n")
+
+
+def _sql_text(composable):
+    """
+    Flatten a composed query into its literal SQL text and placeholder names.
+    
+    Composed.as_string() needs a connection, so walk the structure instead.
+    """
+    if hasattr(composable, 'seq'):
+        return ''.join(_sql_text(part) for part in composable.seq)
+    if hasattr(composable, 'strings'):
+        return '.'.join(f'"{name}"' for name in composable.strings)
+    if hasattr(composable, 'name') and not hasattr(composable, 'string'):
+        return f'%({composable.name})s'
+    return composable.string
+
+
+class TestQueryBuilders:
+    """Test cases for the build_* query builders."""
+    
+    def test_count_query_reuses_template_across_values(self):
+        """
+        Test the template depends only on the query shape, not the values.
+        """
+        first, first_params = security_utils.build_count_query(
+            'applicants', {'term': 'Spring 2025', 'status': 'Accepted'})
+        second, second_params = security_utils.build_count_query(
+            'applicants', {'term': 'Fall 2024', 'status': 'Rejected'})
+        
+        assert first is second
+        assert first_params == {'cond_term': 'Spring 2025', 'cond_status': 'Accepted'}
+        assert second_params == {'cond_term': 'Fall 2024', 'cond_status': 'Rejected'}
+    
+    def test_count_query_binds_conditions_as_placeholders(self):
+        """
+        Test conditions become cond_{field} placeholders and None values are dropped.
+        """
+        template, params = security_utils.build_count_query(
+            'applicants', {'term': "Spring 2025'; DROP TABLE applicants", 'status': None})
+        text = _sql_text(template)
+        
+        assert text == 'SELECT COUNT(*) FROM "applicants" WHERE "term" = %(cond_term)s'
+        assert params == {'cond_term': "Spring 2025'; DROP TABLE applicants"}
+    
+    def test_count_query_without_conditions(self):
+        """
+        Test an empty conditions dict builds an unfiltered count with no params.
+        """
+        template, params = security_utils.build_count_query('applicants', {})
+        
+        assert _sql_text(template) == 'SELECT COUNT(*) FROM "applicants"'
+        assert params == {}
+    
+    def test_average_query(self):
+        """
+        Test the AVG query filters on conditions and non-null averaged fields.
+        """
+        template, params = security_utils.build_average_query(
+            'applicants', ['gpa', 'gre'], {'term': 'Spring 2025'})
+        text = _sql_text(template)
+        
+        assert 'AVG("gpa") as avg_"gpa"' in text
+        assert '"term" = %(cond_term)s' in text
+        assert '"gpa" IS NOT NULL AND "gre" IS NOT NULL' in text
+        assert params == {'cond_term': 'Spring 2025'}
+        assert security_utils.build_average_query(
+            'applicants', ['gpa', 'gre'], {'term': 'Fall 2024'})[0] is template
+    
+    def test_percentage_query(self):
+        """
+        Test the percentage query binds its match value as a parameter.
+        """
+        template, params = security_utils.build_percentage_query(
+            'applicants', 'us_or_international', 'International')
+        
+        assert '"us_or_international" = %(value)s' in _sql_text(template)
+        assert params == {'value': 'International'}
+        assert security_utils.build_percentage_query(
+            'applicants', 'us_or_international', 'American')[0] is template
+    
+    def test_like_query_escapes_pattern(self):
+        """
+        Test the LIKE pattern is sanitized and bound alongside the conditions.
+        """
+        template, params = security_utils.build_like_query(
+            'applicants', 'program', '100%_match', {'degree': 'Masters'})
+        
+        assert _sql_text(template) == (
+            'SELECT COUNT(*) FROM "applicants" '
+            'WHERE "program" LIKE %(pattern)s AND "degree" = %(cond_degree)s'
+        )
+        assert params == {'pattern': '%100\\%\\_match%', 'cond_degree': 'Masters'}
+    
+    @pytest.mark.parametrize("build", [
+        lambda: security_utils.build_count_query('applicants', {'term': 'Spring 2025'}),
+        lambda: security_utils.build_average_query('applicants', ['gpa'], {'term': 'Spring 2025'}),
+        lambda: security_utils.build_percentage_query('applicants', 'status', 'Accepted'),
+        lambda: security_utils.build_like_query('applicants', 'program', 'CS', {'term': 'Spring 2025'}),
+    ])
+    def test_builders_add_no_limit(self, build):
+        """
+        Test none of the builders append a LIMIT to the query.
+        """
+        query, _ = build()
+        assert 'LIMIT' not in _sql_text(query).upper()
+    
+    def test_query_builder_shim_returns_template_and_params(self):
+        """
+        Test the QueryBuilder shim exposes the same tuple-returning builders.
+        """
+        assert security_utils.QueryBuilder.build_count_query(
+            'applicants', {'term': 'Spring 2025'}) == security_utils.build_count_query(
+            'applicants', {'term': 'Spring 2025'})